@@ -17,7 +17,7 @@ run_build() {
   # 'uv' will automatically use the sourced venv
 
   uv pip install pyinstaller || exit 1
-  uv pip install -e ./otto/ || exit 1
+  uv pip install -e "./otto/[speedups]" || exit 1
 
   # Data directories are relative to specpath.
   # We set 'src/' as the specpath so the resulting 'otto.spec' does not
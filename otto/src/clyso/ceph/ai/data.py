@@ -1,7 +1,7 @@
 # Copyright (C) 2025 Clyso
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
-from clyso.ceph.api.schemas import CephReport, OSDTree, PGDump
+from clyso.ceph.api.schemas import CephReport, OSDTree, PGDump, PGDumpLite
 
 
 class CephData:
@@ -9,4 +9,4 @@ class CephData:
         self.ceph_report: CephReport | None = None
         self.ceph_config_dump: list | None = None
         self.ceph_osd_tree: OSDTree | None = None
-        self.ceph_pg_dump: PGDump | None = None
+        self.ceph_pg_dump: PGDump | PGDumpLite | None = None
@@ -14,7 +14,6 @@
 from __future__ import annotations
 
 from typing import Any
-import builtins
 
 from clyso.ceph.ai.helpers import to_version, to_major, to_release
 
@@ -22,8 +21,18 @@ from clyso.ceph.ai.helpers import to_version, to_major, to_release
 class ConfigItem:
     """Represents a single configuration item from ceph config dump"""
 
+    __slots__ = (
+        "can_update_at_runtime",
+        "level",
+        "location_type",
+        "location_value",
+        "mask",
+        "name",
+        "section",
+        "value",
+    )
+
     def __init__(self, data: dict[str, Any]) -> None:
-        super().__init__()
         self.section: str = data.get("section", "")
         self.name: str = data.get("name", "")
         self.value: str = data.get("value", "")
@@ -35,7 +44,7 @@ class ConfigItem:
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from this config item"""
-        return builtins.getattr(self, key, default)
+        return getattr(self, key, default)
 
 
 class CephFacts:
@@ -43,8 +52,21 @@ class CephFacts:
     Extracts and caches commonly needed cluster information from CephData.
     """
 
+    __slots__ = (
+        "ceph_data",
+        "cluster_id",
+        "cluster_name",
+        "deployment_type",
+        "has_separate_cluster_network",
+        "major_version",
+        "num_mons",
+        "num_osds",
+        "num_pools",
+        "release_name",
+        "version",
+    )
+
     def __init__(self, ceph_data: Any) -> None:
-        super().__init__()
         self.ceph_data: Any = ceph_data
 
         # Initialize all attributes with defaults
@@ -59,80 +81,63 @@ class CephFacts:
         self.deployment_type: str = "unknown"
         self.has_separate_cluster_network: bool = False
 
-        self._extract_facts()
+        report = getattr(ceph_data, "ceph_report", None)
+        if report:
+            self._extract_from_report(report)
 
-    def _extract_facts(self) -> None:
-        """Extract all facts from the ceph data"""
-        if (
-            builtins.hasattr(self.ceph_data, "ceph_report")
-            and self.ceph_data.ceph_report
-        ):
-            self._extract_from_report()
-        else:
-            self._set_defaults()
-
-    def _extract_from_report(self) -> None:
+    def _extract_from_report(self, report: Any) -> None:
         """Extract facts from ceph report"""
-        report = self.ceph_data.ceph_report
-
         self.version = to_version(report.version)
         self.major_version = to_major(self.version)
         self.release_name = to_release(self.major_version)
 
-        self.num_osds = builtins.len(report.osdmap.osds)
-        self.num_pools = builtins.len(report.osdmap.pools)
+        osdmap = report.osdmap
+        monmap = report.monmap
 
-        self.num_mons = builtins.len(report.monmap.mons)
+        self.num_osds = len(osdmap.osds)
+        self.num_pools = len(osdmap.pools)
 
-        self.cluster_id = report.monmap.fsid
+        self.num_mons = len(monmap.mons)
 
-        self.deployment_type = self._detect_deployment_type()
+        self.cluster_id = monmap.fsid
 
-        self.has_separate_cluster_network = self._check_separate_cluster_network()
+        self.deployment_type = self._detect_deployment_type(report)
 
-    def _set_defaults(self) -> None:
-        """Set default values when report is not available"""
-        self.version = "unknown"
-        self.major_version = "unknown"
-        self.release_name = "unknown"
-        self.num_osds = 0
-        self.num_pools = 0
-        self.num_mons = 0
-        self.cluster_id = "unknown"
-        self.cluster_name = "ceph"
-        self.deployment_type = "unknown"
-        self.has_separate_cluster_network = False
+        self.has_separate_cluster_network = self._check_separate_cluster_network(report)
 
-    def _detect_deployment_type(self) -> str:
+    def _detect_deployment_type(self, report: Any) -> str:
         """Detect if using cephadm (container) deployment"""
-        if (
-            not builtins.hasattr(self.ceph_data, "ceph_report")
-            or not self.ceph_data.ceph_report
-        ):
-            return "unknown"
-
-        osd_metadata = self.ceph_data.ceph_report.osd_metadata
-        for osd in osd_metadata:
+        for osd in report.osd_metadata:
             if hasattr(osd, "container_image"):
                 return "cephadm"
         return "traditional"
 
-    def _check_separate_cluster_network(self) -> bool:
+    def _check_separate_cluster_network(self, report: Any) -> bool:
         """Check if cluster has separate public and cluster networks"""
-        if (
-            not builtins.hasattr(self.ceph_data, "ceph_report")
-            or not self.ceph_data.ceph_report
-        ):
-            return False
+        # look at a few OSDs, a single one may not be representative
+        for osd in report.osdmap.osds[:4]:
+            public_ip = _strip_port(osd.public_addr)
+            cluster_ip = _strip_port(osd.cluster_addr)
+            if public_ip and cluster_ip and public_ip != cluster_ip:
+                return True
+        return False
 
-        osds = self.ceph_data.ceph_report.osdmap.osds
-        if not osds:
-            return False
 
-        first_osd = osds[0]
-        public_ip: str = first_osd.get("public_addr", "").split(":")[0]
-        cluster_ip: str = first_osd.get("cluster_addr", "").split(":")[0]
-        return public_ip != cluster_ip
+def _strip_port(addr: str) -> str:
+    """
+    Return the IP part of a Ceph entity address.
+
+    Handles addresses like '10.0.0.1:6801/1234', '[fd00::1]:6801/1234' and
+    'v2:10.0.0.1:6800/1234'. Unset addresses (':/0') yield an empty string.
+    """
+    addr = addr.partition("/")[0]
+    for prefix in ("v1:", "v2:", "any:"):
+        if addr.startswith(prefix):
+            addr = addr[len(prefix) :]
+            break
+    if addr.startswith("["):
+        return addr[1:].partition("]")[0]
+    return addr.rpartition(":")[0] if ":" in addr else addr
 
 
 class ConfigLookup:
@@ -140,8 +145,9 @@ class ConfigLookup:
     Provides easy lookup functionality for Ceph configuration values.
     """
 
+    __slots__ = ("by_name", "by_section", "config_dump", "config_map")
+
     def __init__(self, config_dump: list[dict[str, Any]] | None) -> None:
-        super().__init__()
         self.config_dump: list[dict[str, Any]] = config_dump if config_dump else []
 
         # Initialize lookup structures
@@ -162,23 +168,22 @@ class ConfigLookup:
         # Dictionary by name only: {name: [config_items]}
         self.by_name = {}
 
+        config_map = self.config_map
+        by_section = self.by_section
+        by_name = self.by_name
+
         for config_item in self.config_dump:
-            section: str = builtins.str(config_item.get("section", ""))
-            name: str = builtins.str(config_item.get("name", ""))
+            section: str = str(config_item.get("section", ""))
+            name: str = str(config_item.get("name", ""))
 
             # Full lookup
-            key: tuple[str, str] = (section, name)
-            self.config_map[key] = config_item
+            config_map[(section, name)] = config_item
 
             # By section
-            if section not in self.by_section:
-                self.by_section[section] = {}
-            self.by_section[section][name] = config_item
+            by_section.setdefault(section, {})[name] = config_item
 
             # By name (may have multiple entries for different sections)
-            if name not in self.by_name:
-                self.by_name[name] = []
-            self.by_name[name].append(config_item)
+            by_name.setdefault(name, []).append(config_item)
 
     def get_config(
         self, name: str, section: str | None = None
@@ -80,7 +80,7 @@ class OSDPerfCommand:
     def _collect_from_file(self) -> list[dict[str, Any]]:
         """Collect data from file input"""
         try:
-            perf_data = json.loads(Path(self.args.file).read_text())
+            perf_data = json.loads(Path(self.args.file).read_bytes())
             return self.perf_class.process_perf_dump_file(perf_data)
         except FileNotFoundError:
             print(f"Error: Input file '{self.args.file}' not found", file=sys.stderr)
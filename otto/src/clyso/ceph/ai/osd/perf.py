@@ -2,15 +2,21 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from __future__ import annotations
+import math
 import statistics
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 from pydantic import BaseModel
 
 from clyso.ceph.api.loaders import (
     load_osd_perf_from_file,
     load_osd_perf_from_stdin,
 )
-from clyso.ceph.api.commands import ceph_osd_perf_dump
-from clyso.ceph.api.schemas import OSDPerfDumpResponse
+from clyso.ceph.api.commands import ceph_command
+from clyso.ceph.api.schemas import BlueStore, OSDPerfDumpResponse
+
+# upper bound on concurrent 'ceph tell osd.N perf dump' calls
+MAX_COLLECT_WORKERS = 16
 
 
 class OSDMetric(BaseModel):
@@ -54,14 +60,29 @@ class OSDPerf:
     print(f"Cache Misses: {metrics.onode_misses}")
     """
 
-    perf_dump: OSDPerfDumpResponse
     onode_hits: int
     onode_misses: int
     onode_hitrate: float
 
-    def __init__(self, perf_dump: OSDPerfDumpResponse):
-        self.perf_dump = perf_dump
-        self._extract_onode_metrics()
+    def __init__(self, perf_dump: OSDPerfDumpResponse | dict[str, Any]):
+        # a raw perf dump holds thousands of counters; only its bluestore
+        # section is validated up front, the rest when perf_dump is accessed
+        self._perf_data: dict[str, Any] | None = None
+        self._perf_dump: OSDPerfDumpResponse | None = None
+        if isinstance(perf_dump, OSDPerfDumpResponse):
+            self._perf_dump = perf_dump
+            bluestore = perf_dump.bluestore
+        else:
+            self._perf_data = perf_dump
+            bluestore = BlueStore.model_validate(perf_dump.get("bluestore", {}))
+        self._extract_onode_metrics(bluestore)
+
+    @property
+    def perf_dump(self) -> OSDPerfDumpResponse:
+        if self._perf_dump is None:
+            assert self._perf_data is not None
+            self._perf_dump = OSDPerfDumpResponse(**self._perf_data)
+        return self._perf_dump
 
     @classmethod
     def from_file(cls, file_path: str) -> OSDPerf:
@@ -70,8 +91,8 @@ class OSDPerf:
 
     @classmethod
     def from_subprocess(cls, osd_id: int) -> OSDPerf:
-        perf_dump = ceph_osd_perf_dump(osd_id)
-        return cls(perf_dump)
+        perf_data = ceph_command(f"ceph tell osd.{osd_id} perf dump --format=json")
+        return cls(perf_data)
 
     @classmethod
     def from_stdin(cls) -> OSDPerf:
@@ -83,9 +104,9 @@ class OSDPerf:
         perf_dump = OSDPerfDumpResponse.model_validate(perf_data)
         return cls(perf_dump)
 
-    def _extract_onode_metrics(self) -> None:
-        self.onode_hits = self.perf_dump.bluestore.onode_hits
-        self.onode_misses = self.perf_dump.bluestore.onode_misses
+    def _extract_onode_metrics(self, bluestore: BlueStore) -> None:
+        self.onode_hits = bluestore.onode_hits
+        self.onode_misses = bluestore.onode_misses
 
         assert self.onode_hits is not None
         assert self.onode_misses is not None
@@ -122,6 +143,23 @@ class OSDPerf:
         perf_instance = cls.from_data(perf_data)
         return perf_instance.process()
 
+    @classmethod
+    def _collect_one(
+        cls, osd_id: int, osd_metadata: dict[int, dict[str, str]]
+    ) -> list[OSDMetric] | Exception:
+        """Collect metrics from a single OSD, returning the error on failure"""
+        try:
+            metrics = cls.collect_single_osd_metrics(osd_id)
+        except Exception as e:
+            return e
+        if osd_id in osd_metadata:
+            metadata = osd_metadata[osd_id]
+            for metric in metrics:
+                metric.osd_id = osd_id
+                metric.host = metadata.get("hostname", "unknown")
+                metric.device_class = metadata.get("device_class", "unknown")
+        return metrics
+
     @classmethod
     def collect_osd_performance_metrics(
         cls,
@@ -132,19 +170,30 @@ class OSDPerf:
         osd_metrics: list[OSDMetric] = []
         failed_osds: list[int] = []
 
-        for osd_id in osd_ids:
+        if not osd_ids:
+            return osd_metrics, failed_osds
+
+        # each perf dump is a blocking 'ceph tell' round trip, so query the
+        # OSDs concurrently; results are consumed in the order of osd_ids
+        max_workers = min(MAX_COLLECT_WORKERS, len(osd_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(cls._collect_one, osd_id, osd_metadata)
+                for osd_id in osd_ids
+            ]
             try:
-                metrics = cls.collect_single_osd_metrics(osd_id)
-                for metric in metrics:
-                    if osd_id in osd_metadata:
-                        metadata = osd_metadata[osd_id]
-                        metric.osd_id = osd_id
-                        metric.host = metadata.get("hostname", "unknown")
-                        metric.device_class = metadata.get("device_class", "unknown")
-                    osd_metrics.extend(metrics)
-            except Exception as e:
-                print(f"Failed to collect metrics for OSD {osd_id}: {e}")
-                failed_osds.append(osd_id)
+                for osd_id, future in zip(osd_ids, futures):
+                    result = future.result()
+                    if isinstance(result, Exception):
+                        print(f"Failed to collect metrics for OSD {osd_id}: {result}")
+                        failed_osds.append(osd_id)
+                    else:
+                        osd_metrics.extend(result)
+            except BaseException:
+                # a failing ceph command exits from its worker thread, don't
+                # query the remaining OSDs before the exit propagates
+                executor.shutdown(cancel_futures=True)
+                raise
 
         return osd_metrics, failed_osds
 
@@ -160,18 +209,32 @@ def analyze_onode_distribution(
     osd_metrics: list[OSDMetric],
 ) -> OnodeDistributionAnalysis:
     """Analyze onode cache hit rate distribution across OSDs"""
-    hit_rates = [osd.onode_hitrate for osd in osd_metrics]
-
-    if not hit_rates:
+    if not osd_metrics:
         raise ValueError("No valid hit rate data found")
 
+    # single pass for mean, variance (Welford), min and max
+    hit_rates: list[float] = []
+    mean = 0.0
+    m2 = 0.0
+    min_rate = math.inf
+    max_rate = -math.inf
+    for n, osd in enumerate(osd_metrics, start=1):
+        rate = osd.onode_hitrate
+        hit_rates.append(rate)
+        delta = rate - mean
+        mean += delta / n
+        m2 += delta * (rate - mean)
+        min_rate = min(min_rate, rate)
+        max_rate = max(max_rate, rate)
+
+    total = len(hit_rates)
     result = OnodeDistributionAnalysis(
-        total_osds=len(hit_rates),
-        mean_hitrate=statistics.mean(hit_rates),
+        total_osds=total,
+        mean_hitrate=mean,
         median_hitrate=statistics.median(hit_rates),
-        min_hitrate=min(hit_rates),
-        max_hitrate=max(hit_rates),
-        stdev_hitrate=statistics.stdev(hit_rates) if len(hit_rates) > 1 else None,
+        min_hitrate=min_rate,
+        max_hitrate=max_rate,
+        stdev_hitrate=math.sqrt(m2 / (total - 1)) if total > 1 else None,
     )
 
     return result
@@ -199,11 +262,13 @@ def display_results(
     )
     print("-" * 70)
 
-    for osd in osd_metrics:
-        print(
-            f"{str(osd.osd_id):<6} {osd.host:<15} {osd.device_class:<10} "
-            + f"{osd.onode_hits:<12} {osd.onode_misses:<12} {osd.onode_hitrate:<10.3f}"
-        )
+    rows = [
+        f"{str(osd.osd_id):<6} {osd.host:<15} {osd.device_class:<10} "
+        + f"{osd.onode_hits:<12} {osd.onode_misses:<12} {osd.onode_hitrate:<10.3f}"
+        for osd in osd_metrics
+    ]
+    if rows:
+        print("\n".join(rows))
 
 
 class OSDPerfFormatter:
@@ -10,6 +10,15 @@ from clyso.ceph.api.schemas import OSDTree, OSDNode
 class OSDTopology:
     """Manages OSD cluster topology information"""
 
+    __slots__ = (
+        "_device_class_to_osds",
+        "_host_to_osds",
+        "_osd_metadata",
+        "_up_osds",
+        "nodes",
+        "osd_tree",
+    )
+
     def __init__(self):
         self.osd_tree: OSDTree = ceph_osd_tree()
         self.nodes: list[OSDNode] = self.osd_tree.nodes
@@ -17,47 +26,45 @@ class OSDTopology:
         self._device_class_to_osds: dict[str, list[int]] | None = None
         self._up_osds: list[int] | None = None
         self._osd_metadata: dict[int, dict[str, str]] | None = None
-        self._host_lookup: dict[int, str] | None = None
         self._parse_topology()
 
-    def _build_host_lookup(self) -> dict[int, str]:
-        host_lookup: dict[int, str] = {}
-        for node in self.nodes:
-            if node.type == "host" and node.children:
-                for child_id in node.children:
-                    host_lookup[child_id] = node.name
-        return host_lookup
-
-    def _find_osd_host(self, osd_id: int) -> str | None:
-        """Find the host name for a given OSD ID using efficient lookup"""
-        if self._host_lookup is None:
-            self._host_lookup = self._build_host_lookup()
-        return self._host_lookup.get(osd_id)
-
     def _parse_topology(self):
         """Parse OSD tree and build topology mappings"""
         host_to_osds: dict[str, list[int]] = defaultdict(list)
         device_class_to_osds: dict[str, list[int]] = defaultdict(list)
         up_osds: list[int] = []
         osd_metadata: dict[int, dict[str, str]] = {}
+        host_lookup: dict[int, str] = {}
+        up_osd_nodes: list[OSDNode] = []
 
+        # a single pass over the tree maps each child to its host and
+        # collects the up OSDs, whose hosts may appear later in the tree
         for node in self.nodes:
-            if node.type == "osd" and node.status == "up":
-                osd_id = node.id
-                up_osds.append(osd_id)
-
-                # if we can't find the host name an OSD belongs to we will skip this OSD
-                host_name = self._find_osd_host(osd_id)
-                if host_name:
-                    host_to_osds[host_name].append(osd_id)
-
-                    device_class = node.device_class or "unknown"
-                    device_class_to_osds[device_class].append(osd_id)
-
-                    osd_metadata[osd_id] = {
-                        "hostname": host_name,
-                        "device_class": device_class,
-                    }
+            node_type = node.type
+            if node_type == "osd":
+                if node.status == "up":
+                    up_osd_nodes.append(node)
+            elif node_type == "host" and node.children:
+                host_name = node.name
+                for child_id in node.children:
+                    host_lookup[child_id] = host_name
+
+        for node in up_osd_nodes:
+            osd_id = node.id
+            up_osds.append(osd_id)
+
+            # if we can't find the host name an OSD belongs to we will skip this OSD
+            host_name = host_lookup.get(osd_id)
+            if host_name:
+                host_to_osds[host_name].append(osd_id)
+
+                device_class = node.device_class or "unknown"
+                device_class_to_osds[device_class].append(osd_id)
+
+                osd_metadata[osd_id] = {
+                    "hostname": host_name,
+                    "device_class": device_class,
+                }
 
         self._host_to_osds = dict(host_to_osds)
         self._device_class_to_osds = dict(device_class_to_osds)
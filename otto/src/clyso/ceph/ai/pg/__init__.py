@@ -2,7 +2,11 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
 from clyso.ceph.ai.pg.distribution import PGHistogram
-from clyso.ceph.api.commands import ceph_osd_tree, ceph_pg_dump
+from clyso.ceph.api.commands import (
+    ceph_fetch_parallel,
+    ceph_osd_tree,
+    ceph_pg_dump_lite,
+)
 import json
 from pathlib import Path
 
@@ -77,21 +81,31 @@ def pg_distribution(args):
 
     Now using typed API functions for better type safety and validation.
     """
-    if args.osd_tree_json:
-        osd_weights = json.loads(Path(args.osd_tree_json).read_text())
-    elif Path("osd_info-tree_json").exists():
-        osd_weights = json.loads(Path("osd_info-tree_json").read_text())
+    osd_tree_json = args.osd_tree_json
+    if not osd_tree_json and Path("osd_info-tree_json").exists():
+        osd_tree_json = "osd_info-tree_json"
+
+    pg_dump_json = args.pg_dump_json
+    if not pg_dump_json and Path("pg_info-dump_json").exists():
+        pg_dump_json = "pg_info-dump_json"
+
+    # fetch whatever is not given as a file from the cluster, concurrently
+    fetch = []
+    if not osd_tree_json:
+        fetch.append(ceph_osd_tree)
+    if not pg_dump_json:
+        fetch.append(ceph_pg_dump_lite)
+    fetched = iter(ceph_fetch_parallel(*fetch))
+
+    if osd_tree_json:
+        osd_weights = json.loads(Path(osd_tree_json).read_bytes())
     else:
-        osd_tree = ceph_osd_tree()
-        osd_weights = osd_tree.model_dump()
+        osd_weights = next(fetched)
 
-    if args.pg_dump_json:
-        pg_stats = json.loads(Path(args.pg_dump_json).read_text())
-    elif Path("pg_info-dump_json").exists():
-        pg_stats = json.loads(Path("pg_info-dump_json").read_text())
+    if pg_dump_json:
+        pg_stats = json.loads(Path(pg_dump_json).read_bytes())
     else:
-        pg_dump = ceph_pg_dump()
-        pg_stats = pg_dump.model_dump()
+        pg_stats = next(fetched)
 
     pg_histogram = PGHistogram(osd_weights, pg_stats, args)
     pg_histogram.print_ascii_histogram()
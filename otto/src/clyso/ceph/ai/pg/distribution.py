@@ -3,8 +3,9 @@
 
 from clyso.ceph.ai.data import CephData
 from clyso.ceph.ai.pg.histogram import histogram, calculate_histogram, DataPoint, median
-from clyso.ceph.api.schemas import OSDTree, PGDump
-from collections import defaultdict
+from clyso.ceph.api.schemas import OSDTree, PGDump, PGDumpLite
+from collections import Counter, defaultdict
+from itertools import chain
 from types import SimpleNamespace
 from typing import TypedDict, overload
 import json
@@ -16,10 +17,19 @@ class PoolPGInfo(TypedDict):
 
 
 class PGHistogram:
-    def __init__(self, osd_tree: dict, pg_dump: dict, flags):
+    def __init__(
+        self, osd_tree: OSDTree | dict, pg_dump: PGDump | PGDumpLite | dict, flags
+    ):
         self.data = CephData()
-        self.data.ceph_osd_tree = OSDTree.model_validate(osd_tree)
-        self.data.ceph_pg_dump = PGDump.model_validate(pg_dump)
+        # models are used as they are, raw dicts are validated first
+        if isinstance(osd_tree, OSDTree):
+            self.data.ceph_osd_tree = osd_tree
+        else:
+            self.data.ceph_osd_tree = OSDTree.model_validate(osd_tree)
+        if isinstance(pg_dump, (PGDump, PGDumpLite)):
+            self.data.ceph_pg_dump = pg_dump
+        else:
+            self.data.ceph_pg_dump = PGDumpLite.model_validate(pg_dump)
         self.flags = flags
 
         self.osd_weights = self.get_weights()
@@ -56,14 +66,17 @@ class PGHistogram:
             return defaultdict(int)
 
         ceph_pg_stats = self.data.ceph_pg_dump.pg_map.pg_stats
-        osds = defaultdict(int)
-        for pg in ceph_pg_stats:
-            poolid = pg.pgid.split(".")[0]
-            if self.flags.pools and poolid not in self.flags.pools:
-                continue
-            for osd in pg.acting:
-                if osd >= 0 and osd < 1000000:
-                    osds[osd] += 1
+        pools = self.flags.pools
+        osds = Counter(
+            chain.from_iterable(
+                pg.acting
+                for pg in ceph_pg_stats
+                if not pools or pg.pgid.split(".")[0] in pools
+            )
+        )
+        # drop placeholders for unmapped slots (e.g. CRUSH_ITEM_NONE)
+        for osd in [osd for osd in osds if not 0 <= osd < 1000000]:
+            del osds[osd]
 
         return osds
 
@@ -22,10 +22,12 @@ Example usage:
 """
 
 from .commands import (
+    ceph_fetch_parallel,
     ceph_osd_df,
     ceph_osd_dump,
     ceph_osd_tree,
     ceph_pg_dump,
+    ceph_pg_dump_lite,
     ceph_fs_status,
     ceph_mds_stat,
     ceph_mds_session_ls,
@@ -37,6 +39,7 @@ from .schemas import (
     OSDNode,
     OSDTree,
     PGDump,
+    PGDumpLite,
     PGMap,
     PGStat,
     PoolConfig,
@@ -54,15 +57,18 @@ __all__ = [
     # Schema classes
     "OSDTree",
     "PGDump",
+    "PGDumpLite",
     "PGMap",
     "PGStat",
     "PoolConfig",
     "PoolStat",
+    "ceph_fetch_parallel",
     "ceph_osd_df",
     "ceph_osd_dump",
     # Command functions
     "ceph_osd_tree",
     "ceph_pg_dump",
+    "ceph_pg_dump_lite",
     "ceph_fs_status",
     "ceph_mds_stat",
     "ceph_mds_session_ls",
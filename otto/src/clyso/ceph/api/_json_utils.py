@@ -4,11 +4,19 @@
 """Internal JSON parsing utilities for handling Ceph's non-standard JSON output."""
 
 import json
-import math
-from typing import Any
+from typing import Any, TypeVar
 
+from pydantic import BaseModel, ValidationError
 
-def parse_ceph_json(json_data: str) -> Any:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def parse_ceph_json(json_data: str | bytes) -> Any:
     """
     Parse JSON data from Ceph with special handling for non-standard values.
 
@@ -16,25 +24,53 @@ def parse_ceph_json(json_data: str) -> Any:
     which are not valid JSON. This function handles those cases by converting them
     to valid JSON 'Infinity', '-Infinity', and 'NaN' before parsing.
 
+    When orjson is installed, the data is first parsed with it as-is, which
+    covers the common case of valid JSON without decoding or copying the
+    input. Only data orjson rejects goes through the sanitizing path.
+
     Args:
-        json_data: Raw JSON string from Ceph command output
+        json_data: Raw JSON string or bytes from Ceph command output
 
     Returns:
         Parsed Python object (dict, list, etc.)
     """
+    if orjson is not None:
+        try:
+            return orjson.loads(json_data)
+        except orjson.JSONDecodeError:
+            pass
 
-    def parse_json_constants(arg):
-        if arg == "Infinity":
-            return math.inf
-        elif arg == "-Infinity":
-            return -math.inf
-        elif arg == "NaN":
-            return math.nan
-        return None
+    if isinstance(json_data, bytes):
+        json_data = json_data.decode("utf-8")
 
     # Replace non-standard JSON constants with valid ones
     json_data = json_data.replace(" inf,", " Infinity,")
     json_data = json_data.replace(" -inf,", " -Infinity,")
     json_data = json_data.replace(" nan,", " NaN,")
 
-    return json.loads(json_data, parse_constant=parse_json_constants)
+    # json decodes Infinity, -Infinity and NaN to the float constants natively
+    return json.loads(json_data)
+
+
+def validate_ceph_json(model: type[ModelT], json_data: str | bytes) -> ModelT:
+    """
+    Validate JSON data from Ceph directly into a pydantic model.
+
+    The data is handed to pydantic's JSON parser as-is, so no intermediate
+    Python dict tree is built. Only if that parser rejects the input, which
+    happens for Ceph's non-standard 'inf'/'nan' constants, is the data
+    sanitized with parse_ceph_json() and validated from Python objects.
+
+    Args:
+        model: Pydantic model class to validate into
+        json_data: Raw JSON string or bytes from Ceph command output
+
+    Returns:
+        Validated model instance
+    """
+    try:
+        return model.model_validate_json(json_data)
+    except ValidationError as e:
+        if not any(error["type"] == "json_invalid" for error in e.errors()):
+            raise
+    return model.model_validate(parse_ceph_json(json_data))
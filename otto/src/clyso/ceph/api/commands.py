@@ -8,18 +8,22 @@ This module provides strongly-typed wrapper functions for executing Ceph command
 and parsing their JSON output with proper validation using Pydantic models.
 """
 
+import queue
+import shlex
 import sys
+import threading
+from collections.abc import Callable
 from typing import Any
 import subprocess
-from ._json_utils import parse_ceph_json
+from ._json_utils import parse_ceph_json, validate_ceph_json
 from .schemas import (
     CephReport,
     MalformedCephDataError,
     OSDDFResponse,
     OSDDumpResponse,
-    OSDPerfDumpResponse,
     OSDTree,
     PGDump,
+    PGDumpLite,
     CephfsStatusResponse,
     CephfsMDSStatResponse,
     CephfsSessionListResponse,
@@ -35,70 +39,126 @@ from .schemas import (
 )
 
 
-def _execute_ceph_command(command: str, timeout: int = 30) -> Any:
+# seconds the ceph CLI may spend connecting to the monitors before giving up
+CEPH_CONNECT_TIMEOUT = 5
+
+# pre-split argv of the fixed cluster map commands
+_CMD_OSD_TREE = ("ceph", "osd", "tree", "--format=json")
+_CMD_PG_DUMP = ("ceph", "pg", "dump", "--format=json")
+_CMD_OSD_DF = ("ceph", "osd", "df", "--format=json")
+_CMD_OSD_DUMP = ("ceph", "osd", "dump", "--format=json")
+
+
+def _run_ceph_argv(argv: tuple[str, ...], timeout: int = 30) -> bytes:
+    if argv[0] == "ceph":
+        # fail fast on unreachable monitors instead of running into timeout
+        argv = (argv[0], f"--connect-timeout={CEPH_CONNECT_TIMEOUT}", *argv[1:])
     try:
-        out = subprocess.check_output(
-            command.split(), stderr=subprocess.DEVNULL, timeout=timeout
-        ).decode("utf-8")
+        return subprocess.check_output(argv, stderr=subprocess.DEVNULL, timeout=timeout)
     except subprocess.CalledProcessError:
         print("ERROR: ceph command is no where to be found")
         sys.exit(1)
     except subprocess.TimeoutExpired:
+        command = " ".join(argv)
         print(f"ERROR: command '{command}' timed out after {timeout} seconds")
         sys.exit(1)
-    return parse_ceph_json(out)
+
+
+def _run_ceph_command(command: str, timeout: int = 30) -> bytes:
+    return _run_ceph_argv(tuple(shlex.split(command)), timeout=timeout)
+
+
+def _execute_ceph_command(command: str, timeout: int = 30) -> Any:
+    return parse_ceph_json(_run_ceph_command(command, timeout=timeout))
 
 
 def ceph_osd_tree() -> OSDTree:
     try:
-        raw_data = _execute_ceph_command("ceph osd tree --format=json")
-        return OSDTree.model_validate(raw_data)
+        raw_data = _run_ceph_argv(_CMD_OSD_TREE)
+        return validate_ceph_json(OSDTree, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get OSD tree: {e}") from e
 
 
 def ceph_pg_dump() -> PGDump:
     try:
-        raw_data = _execute_ceph_command("ceph pg dump --format=json")
-        return PGDump.model_validate(raw_data)
+        raw_data = _run_ceph_argv(_CMD_PG_DUMP)
+        return validate_ceph_json(PGDump, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get PG dump: {e}") from e
 
 
-def ceph_osd_perf_dump(osd_id: int) -> OSDPerfDumpResponse:
-    try:
-        raw_data = _execute_ceph_command(f"ceph tell osd.{osd_id} perf dump")
-        return OSDPerfDumpResponse(**raw_data)
-    except Exception as e:
-        raise MalformedCephDataError(
-            f"Failed to get OSD {osd_id} perf dump: {e}"
-        ) from e
-
-
 def ceph_report() -> CephReport:
     try:
-        raw_data = _execute_ceph_command("ceph report")
-        return CephReport.model_validate(raw_data)
+        raw_data = _run_ceph_command("ceph report")
+        return validate_ceph_json(CephReport, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get cluster report: {e}") from e
 
 
 def ceph_osd_df() -> OSDDFResponse:
     try:
-        raw_data = _execute_ceph_command("ceph osd df --format=json")
-        return OSDDFResponse.model_validate(raw_data)
+        raw_data = _run_ceph_argv(_CMD_OSD_DF)
+        return validate_ceph_json(OSDDFResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get OSD DF: {e}") from e
 
 
 def ceph_osd_dump() -> OSDDumpResponse:
     try:
-        raw_data = _execute_ceph_command("ceph osd dump --format=json")
-        return OSDDumpResponse.model_validate(raw_data)
+        raw_data = _run_ceph_argv(_CMD_OSD_DUMP)
+        return validate_ceph_json(OSDDumpResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get OSD dump: {e}") from e
 
 
+def ceph_pg_dump_lite() -> PGDumpLite:
+    """Get the PG dump reduced to PG ids and their OSD mappings."""
+    try:
+        raw_data = _run_ceph_argv(_CMD_PG_DUMP)
+        return validate_ceph_json(PGDumpLite, raw_data)
+    except Exception as e:
+        raise MalformedCephDataError(f"Failed to get PG dump: {e}") from e
+
+
+def ceph_fetch_parallel(*funcs: Callable[[], Any]) -> list[Any]:
+    """
+    Run independent ceph command wrappers concurrently.
+
+    Each wrapper spends most of its time waiting for the ceph CLI, so e.g.
+    ceph_fetch_parallel(ceph_osd_tree, ceph_pg_dump) takes about as long as
+    the slower of the two commands. Results are returned in argument order.
+    The first error raised by a wrapper, including the SystemExit of a
+    failed command, is re-raised without waiting for the other commands.
+    """
+    if len(funcs) <= 1:
+        return [func() for func in funcs]
+
+    done: queue.SimpleQueue[tuple[int, BaseException | None, Any]] = queue.SimpleQueue()
+
+    def run(index: int, func: Callable[[], Any]) -> None:
+        try:
+            done.put((index, None, func()))
+        except BaseException as e:  # noqa: BLE001
+            # _run_ceph_argv reports command failures with sys.exit(), so
+            # SystemExit (and KeyboardInterrupt) must be handed to the caller
+            # too, otherwise it would wait for this result forever
+            done.put((index, e, None))
+
+    # daemon threads, so exiting on an error does not join the commands
+    # that are still running
+    for index, func in enumerate(funcs):
+        threading.Thread(target=run, args=(index, func), daemon=True).start()
+
+    results: list[Any] = [None] * len(funcs)
+    for _ in funcs:
+        index, error, result = done.get()
+        if error is not None:
+            raise error
+        results[index] = result
+    return results
+
+
 def ceph_command(command: str, timeout: int = 30) -> dict[str, Any]:
     try:
         raw_data = _execute_ceph_command(command, timeout=timeout)
@@ -111,22 +171,18 @@ def ceph_command(command: str, timeout: int = 30) -> dict[str, Any]:
 
 def ceph_fs_status(fs_name: str | None = None) -> CephfsStatusResponse:
     try:
-        if fs_name:
-            command = f"ceph fs status {fs_name} --format=json".strip()
-        else:
-            command = "ceph fs status --format=json".strip()
-
-        raw_data = _execute_ceph_command(command)
-        return CephfsStatusResponse.model_validate(raw_data)
+        argv = ("ceph", "fs", "status", *((fs_name,) if fs_name else ()))
+        raw_data = _run_ceph_argv((*argv, "--format=json"))
+        return validate_ceph_json(CephfsStatusResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get CephFS status: {e}") from e
 
 
 def ceph_mds_stat(mds_name: str = "") -> CephfsMDSStatResponse:
     try:
-        command = f"ceph mds stat {mds_name} --format=json".strip()
-        raw_data = _execute_ceph_command(command)
-        return CephfsMDSStatResponse.model_validate(raw_data)
+        argv = ("ceph", "mds", "stat", *((mds_name,) if mds_name else ()))
+        raw_data = _run_ceph_argv((*argv, "--format=json"))
+        return validate_ceph_json(CephfsMDSStatResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get MDS stat: {e}") from e
 
@@ -134,26 +190,26 @@ def ceph_mds_stat(mds_name: str = "") -> CephfsMDSStatResponse:
 def ceph_mds_session_ls(mds_name: str = "") -> CephfsSessionListResponse:
     """Get CephFS session list from MDS daemon."""
     try:
-        raw_data = _execute_ceph_command(
-            f"ceph tell mds.{mds_name} session ls --format=json"
+        raw_data = _run_ceph_argv(
+            ("ceph", "tell", f"mds.{mds_name}", "session", "ls", "--format=json")
         )
-        return CephfsSessionListResponse.model_validate(raw_data)
+        return validate_ceph_json(CephfsSessionListResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get MDS session list: {e}") from e
 
 
 def radosgw_admin_zone_get() -> RGWZoneResponse:
     try:
-        raw_data = _execute_ceph_command("radosgw-admin zone get --format=json")
-        return RGWZoneResponse.model_validate(raw_data)
+        raw_data = _run_ceph_command("radosgw-admin zone get --format=json")
+        return validate_ceph_json(RGWZoneResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get RGW zone: {e}") from e
 
 
 def radosgw_admin_bucket_list() -> RGWBucketListResponse:
     try:
-        raw_data = _execute_ceph_command("radosgw-admin bucket list --format=json")
-        return RGWBucketListResponse.model_validate(raw_data)
+        raw_data = _run_ceph_command("radosgw-admin bucket list --format=json")
+        return validate_ceph_json(RGWBucketListResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get RGW bucket list: {e}") from e
 
@@ -165,9 +221,9 @@ def radosgw_admin_bucket_radoslist(bucket: str) -> list[str]:
     Note: This command returns plain text (one object per line), not JSON.
     """
     try:
-        cmd = f"radosgw-admin bucket radoslist --bucket {bucket}"
+        cmd = ["radosgw-admin", "bucket", "radoslist", "--bucket", bucket]
         out = subprocess.check_output(
-            cmd.split(), stderr=subprocess.DEVNULL, timeout=30
+            cmd, stderr=subprocess.DEVNULL, timeout=30
         ).decode("utf-8")
 
         rados_objects = [line.strip() for line in out.splitlines() if line.strip()]
@@ -186,10 +242,10 @@ def radosgw_admin_bucket_radoslist(bucket: str) -> list[str]:
 def radosgw_admin_bucket_list_objects(bucket: str) -> RGWBucketObjectListResponse:
     """Get detailed object list for a specific bucket."""
     try:
-        raw_data = _execute_ceph_command(
-            f"radosgw-admin bucket list --bucket {bucket} --format=json"
+        raw_data = _run_ceph_argv(
+            ("radosgw-admin", "bucket", "list", "--bucket", bucket, "--format=json")
         )
-        return RGWBucketObjectListResponse.model_validate(raw_data)
+        return validate_ceph_json(RGWBucketObjectListResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(
             f"Failed to get bucket object list for {bucket}: {e}"
@@ -199,8 +255,8 @@ def radosgw_admin_bucket_list_objects(bucket: str) -> RGWBucketObjectListRespons
 def ceph_osd_crush_dump() -> CrushMap:
     """Get CRUSH map dump."""
     try:
-        raw_data = _execute_ceph_command("ceph osd crush dump --format=json")
-        return CrushMap.model_validate(raw_data)
+        raw_data = _run_ceph_command("ceph osd crush dump --format=json")
+        return validate_ceph_json(CrushMap, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get CRUSH map: {e}") from e
 
@@ -208,10 +264,10 @@ def ceph_osd_crush_dump() -> CrushMap:
 def radosgw_admin_zone_get_by_id(zone_id: str) -> RGWZoneResponse:
     """Get RGW zone configuration by zone ID."""
     try:
-        raw_data = _execute_ceph_command(
-            f"radosgw-admin zone get --zone-id {zone_id} --format=json"
+        raw_data = _run_ceph_argv(
+            ("radosgw-admin", "zone", "get", "--zone-id", zone_id, "--format=json")
         )
-        return RGWZoneResponse.model_validate(raw_data)
+        return validate_ceph_json(RGWZoneResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get RGW zone {zone_id}: {e}") from e
 
@@ -219,10 +275,17 @@ def radosgw_admin_zone_get_by_id(zone_id: str) -> RGWZoneResponse:
 def radosgw_admin_zonegroup_get(zonegroup_id: str) -> RGWZonegroupResponse:
     """Get RGW zonegroup configuration."""
     try:
-        raw_data = _execute_ceph_command(
-            f"radosgw-admin zonegroup get --zonegroup-id {zonegroup_id} --format=json"
+        raw_data = _run_ceph_argv(
+            (
+                "radosgw-admin",
+                "zonegroup",
+                "get",
+                "--zonegroup-id",
+                zonegroup_id,
+                "--format=json",
+            )
         )
-        return RGWZonegroupResponse.model_validate(raw_data)
+        return validate_ceph_json(RGWZonegroupResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(
             f"Failed to get RGW zonegroup {zonegroup_id}: {e}"
@@ -234,10 +297,19 @@ def radosgw_admin_bucket_stats(
 ) -> RGWBucketStatsResponse:
     """Get bucket statistics for a user."""
     try:
-        raw_data = _execute_ceph_command(
-            f"radosgw-admin bucket stats --uid {user} --max-entries {max_entries} --format=json"
+        raw_data = _run_ceph_argv(
+            (
+                "radosgw-admin",
+                "bucket",
+                "stats",
+                "--uid",
+                user,
+                "--max-entries",
+                str(max_entries),
+                "--format=json",
+            )
         )
-        return RGWBucketStatsResponse.model_validate(raw_data)
+        return validate_ceph_json(RGWBucketStatsResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(
             f"Failed to get bucket stats for user {user}: {e}"
@@ -247,8 +319,8 @@ def radosgw_admin_bucket_stats(
 def radosgw_admin_global_quota_get() -> RGWGlobalQuotaResponse:
     """Get global quota settings."""
     try:
-        raw_data = _execute_ceph_command("radosgw-admin global quota get --format=json")
-        return RGWGlobalQuotaResponse.model_validate(raw_data)
+        raw_data = _run_ceph_command("radosgw-admin global quota get --format=json")
+        return validate_ceph_json(RGWGlobalQuotaResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get global quota: {e}") from e
 
@@ -256,8 +328,8 @@ def radosgw_admin_global_quota_get() -> RGWGlobalQuotaResponse:
 def radosgw_admin_user_list() -> RGWUserListResponse:
     """Get list of all RGW users."""
     try:
-        raw_data = _execute_ceph_command("radosgw-admin user list --format=json")
-        return RGWUserListResponse.model_validate(raw_data)
+        raw_data = _run_ceph_command("radosgw-admin user list --format=json")
+        return validate_ceph_json(RGWUserListResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get user list: {e}") from e
 
@@ -265,9 +337,9 @@ def radosgw_admin_user_list() -> RGWUserListResponse:
 def radosgw_admin_user_info(user: str) -> RGWUserInfoResponse:
     """Get user information."""
     try:
-        raw_data = _execute_ceph_command(
-            f"radosgw-admin user info --uid {user} --format=json"
+        raw_data = _run_ceph_argv(
+            ("radosgw-admin", "user", "info", "--uid", user, "--format=json")
         )
-        return RGWUserInfoResponse.model_validate(raw_data)
+        return validate_ceph_json(RGWUserInfoResponse, raw_data)
     except Exception as e:
         raise MalformedCephDataError(f"Failed to get user info for {user}: {e}") from e
@@ -9,7 +9,7 @@ from typing import Any
 
 from pydantic import ValidationError
 
-from ._json_utils import parse_ceph_json
+from ._json_utils import parse_ceph_json, validate_ceph_json
 from .schemas import CephReport, OSDPerfDumpResponse, OSDTree, PGDump
 
 
@@ -22,9 +22,8 @@ class DataLoadingError(Exception):
 def load_ceph_report(file_path: str) -> CephReport:
     """Load Ceph report from JSON file."""
     try:
-        content = Path(file_path).read_text()
-        raw_data = parse_ceph_json(content)
-        return CephReport.model_validate(raw_data)
+        content = Path(file_path).read_bytes()
+        return validate_ceph_json(CephReport, content)
     except FileNotFoundError:
         raise DataLoadingError(f"Ceph report file '{file_path}' not found")
     except ValidationError as e:
@@ -40,9 +39,8 @@ def load_ceph_report(file_path: str) -> CephReport:
 def load_osd_tree(file_path: str) -> OSDTree:
     """Load OSD tree from JSON file."""
     try:
-        content = Path(file_path).read_text()
-        raw_data = parse_ceph_json(content)
-        return OSDTree.model_validate(raw_data)
+        content = Path(file_path).read_bytes()
+        return validate_ceph_json(OSDTree, content)
     except FileNotFoundError:
         raise DataLoadingError(f"OSD tree file '{file_path}' not found")
     except ValidationError as e:
@@ -58,9 +56,8 @@ def load_osd_tree(file_path: str) -> OSDTree:
 def load_pg_dump(file_path: str) -> PGDump:
     """Load PG dump from JSON file."""
     try:
-        content = Path(file_path).read_text()
-        raw_data = parse_ceph_json(content)
-        return PGDump.model_validate(raw_data)
+        content = Path(file_path).read_bytes()
+        return validate_ceph_json(PGDump, content)
     except FileNotFoundError:
         raise DataLoadingError(f"PG dump file '{file_path}' not found")
     except ValidationError as e:
@@ -76,7 +73,7 @@ def load_pg_dump(file_path: str) -> PGDump:
 def load_config_dump(file_path: str) -> list[dict[str, Any]]:
     """Load config dump from JSON file."""
     try:
-        content = Path(file_path).read_text()
+        content = Path(file_path).read_bytes()
         raw_data = parse_ceph_json(content)
         if not isinstance(raw_data, list):
             raise DataLoadingError(
@@ -94,7 +91,7 @@ def load_config_dump(file_path: str) -> list[dict[str, Any]]:
 def load_osd_perf_from_file(file_path: str) -> OSDPerfDumpResponse:
     """Load OSD performance dump from JSON file."""
     try:
-        content = Path(file_path).read_text()
+        content = Path(file_path).read_bytes()
         return OSDPerfDumpResponse.model_validate_json(content)
     except FileNotFoundError:
         raise DataLoadingError(f"Performance data file '{file_path}' not found")
@@ -107,7 +104,7 @@ def load_osd_perf_from_file(file_path: str) -> OSDPerfDumpResponse:
 def load_osd_perf_from_stdin() -> OSDPerfDumpResponse:
     """Load OSD performance dump from stdin."""
     try:
-        content = sys.stdin.read()
+        content = sys.stdin.buffer.read()
         return OSDPerfDumpResponse.model_validate_json(content)
     except ValidationError as e:
         raise DataLoadingError(
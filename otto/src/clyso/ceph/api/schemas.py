@@ -11,7 +11,7 @@ This schema handles different ceph versions:
 
 Older Ceph versions may not have newer metrics/fields so we use optional types with defaults:
   - field: Type | None = None
-  - field: Type = Field(default=value)
+  - field: Type = value
 
 Newer Ceph versions may add fields not yet in our schema. All models inherit from
 CephBaseModel which has extra="allow" to accept unknown fields gracefully.
@@ -24,17 +24,21 @@ from __future__ import annotations
 import pathlib
 from typing import Any, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, RootModel
+from pydantic import BaseModel, ConfigDict, Field, RootModel, SkipValidation
+
+# CRUSH_ITEM_NONE, used by Ceph for unset CRUSH item ids
+_CRUSH_ITEM_NONE = 0x7FFFFFFF
 
 
 class CephBaseModel(BaseModel):
     """Base model for all Ceph schemas with forward-compatibility settings.
 
     This allows schemas to accept extra fields from newer Ceph versions
-    without validation errors.
+    without validation errors. Validators are built on first use rather
+    than at import, so commands only pay for the schemas they load.
     """
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
 
 class MalformedCephDataError(Exception):
@@ -47,34 +51,34 @@ class OpQueueAgeHist(CephBaseModel):
     """Schema for operation queue age histogram."""
 
     histogram: list[int]
-    upper_bound: int = Field(default=0)
+    upper_bound: int = 0
 
 
 class PerfStat(CephBaseModel):
     """Schema for OSD performance statistics."""
 
-    commit_latency_ms: int = Field(default=0)
-    apply_latency_ms: int = Field(default=0)
-    commit_latency_ns: int = Field(default=0)
-    apply_latency_ns: int = Field(default=0)
+    commit_latency_ms: int = 0
+    apply_latency_ms: int = 0
+    commit_latency_ns: int = 0
+    apply_latency_ns: int = 0
 
 
 class OSDNode(CephBaseModel):
     """Schema for an OSD node in the OSD tree."""
 
-    id: int = Field(default=0)
-    name: str = Field(default="")
-    type: str = Field(default="")
-    type_id: int = Field(default=0)
+    id: int = 0
+    name: str = ""
+    type: str = ""
+    type_id: int = 0
     children: list[int] = Field(default_factory=list)
-    device_class: str | None = Field(default=None)
-    crush_weight: float | None = Field(default=None)
-    depth: int | None = Field(default=None)
+    device_class: str | None = None
+    crush_weight: float | None = None
+    depth: int | None = None
     pool_weights: dict[str, float] = Field(default_factory=dict)
-    exists: int | None = Field(default=None)
-    status: str | None = Field(default=None)
-    reweight: float | None = Field(default=None)
-    primary_affinity: float | None = Field(default=None)
+    exists: int | None = None
+    status: str | None = None
+    reweight: float | None = None
+    primary_affinity: float | None = None
 
 
 class OSDTree(CephBaseModel):
@@ -84,8 +88,8 @@ class OSDTree(CephBaseModel):
     stray: list[Any] = Field(default_factory=list)
 
     @classmethod
-    def loads(cls, raw: str) -> OSDTree:
-        """Parse OSD tree from JSON string."""
+    def loads(cls, raw: str | bytes) -> OSDTree:
+        """Parse OSD tree from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -94,70 +98,71 @@ class OSDTree(CephBaseModel):
     @classmethod
     def load(cls, path: pathlib.Path) -> OSDTree:
         """Load and parse OSD tree from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
 class PGStatSum(CephBaseModel):
     """Schema for PG statistics summary."""
 
-    num_bytes: int = Field(default=0)
-    num_objects: int = Field(default=0)
-    num_object_clones: int = Field(default=0)
-    num_object_copies: int = Field(default=0)
-    num_objects_missing_on_primary: int = Field(default=0)
-    num_objects_missing: int = Field(default=0)
-    num_objects_degraded: int = Field(default=0)
-    num_objects_misplaced: int = Field(default=0)
-    num_objects_unfound: int = Field(default=0)
-    num_objects_dirty: int = Field(default=0)
-    num_whiteouts: int = Field(default=0)
-    num_read: int = Field(default=0)
-    num_read_kb: int = Field(default=0)
-    num_write: int = Field(default=0)
-    num_write_kb: int = Field(default=0)
-    num_scrub_errors: int = Field(default=0)
-    num_shallow_scrub_errors: int = Field(default=0)
-    num_deep_scrub_errors: int = Field(default=0)
-    num_objects_recovered: int = Field(default=0)
-    num_bytes_recovered: int = Field(default=0)
-    num_keys_recovered: int = Field(default=0)
-    num_objects_omap: int = Field(default=0)
-    num_objects_hit_set_archive: int = Field(default=0)
-    num_bytes_hit_set_archive: int = Field(default=0)
-    num_flush: int = Field(default=0)
-    num_flush_kb: int = Field(default=0)
-    num_evict: int = Field(default=0)
-    num_evict_kb: int = Field(default=0)
-    num_promote: int = Field(default=0)
-    num_flush_mode_high: int = Field(default=0)
-    num_flush_mode_low: int = Field(default=0)
-    num_evict_mode_some: int = Field(default=0)
-    num_evict_mode_full: int = Field(default=0)
-    num_objects_pinned: int = Field(default=0)
-    num_legacy_snapsets: int = Field(default=0)
-    num_large_omap_objects: int = Field(default=0)
-    num_objects_manifest: int = Field(default=0)
-    num_omap_bytes: int = Field(default=0)
-    num_omap_keys: int = Field(default=0)
-    num_objects_repaired: int = Field(default=0)
+    num_bytes: int = 0
+    num_objects: int = 0
+    num_object_clones: int = 0
+    num_object_copies: int = 0
+    num_objects_missing_on_primary: int = 0
+    num_objects_missing: int = 0
+    num_objects_degraded: int = 0
+    num_objects_misplaced: int = 0
+    num_objects_unfound: int = 0
+    num_objects_dirty: int = 0
+    num_whiteouts: int = 0
+    num_read: int = 0
+    num_read_kb: int = 0
+    num_write: int = 0
+    num_write_kb: int = 0
+    num_scrub_errors: int = 0
+    num_shallow_scrub_errors: int = 0
+    num_deep_scrub_errors: int = 0
+    num_objects_recovered: int = 0
+    num_bytes_recovered: int = 0
+    num_keys_recovered: int = 0
+    num_objects_omap: int = 0
+    num_objects_hit_set_archive: int = 0
+    num_bytes_hit_set_archive: int = 0
+    num_flush: int = 0
+    num_flush_kb: int = 0
+    num_evict: int = 0
+    num_evict_kb: int = 0
+    num_promote: int = 0
+    num_flush_mode_high: int = 0
+    num_flush_mode_low: int = 0
+    num_evict_mode_some: int = 0
+    num_evict_mode_full: int = 0
+    num_objects_pinned: int = 0
+    num_legacy_snapsets: int = 0
+    num_large_omap_objects: int = 0
+    num_objects_manifest: int = 0
+    num_omap_bytes: int = 0
+    num_omap_keys: int = 0
+    num_objects_repaired: int = 0
 
 
 class PGStoreStats(CephBaseModel):
     """Schema for PG store statistics."""
 
-    total: int = Field(default=0)
-    available: int = Field(default=0)
-    internally_reserved: int = Field(default=0)
-    allocated: int = Field(default=0)
-    data_stored: int = Field(default=0)
-    data_compressed: int = Field(default=0)
-    data_compressed_allocated: int = Field(default=0)
-    data_compressed_original: int = Field(default=0)
-    omap_allocated: int = Field(default=0)
-    internal_metadata: int = Field(default=0)
+    total: int = 0
+    available: int = 0
+    internally_reserved: int = 0
+    allocated: int = 0
+    data_stored: int = 0
+    data_compressed: int = 0
+    data_compressed_allocated: int = 0
+    data_compressed_original: int = 0
+    omap_allocated: int = 0
+    internal_metadata: int = 0
 
 
 class PGStatsSum(CephBaseModel):
@@ -165,11 +170,11 @@ class PGStatsSum(CephBaseModel):
 
     stat_sum: PGStatSum
     store_stats: PGStoreStats | None = None
-    log_size: int = Field(default=0)
-    ondisk_log_size: int = Field(default=0)
-    up: int = Field(default=0)
-    acting: int = Field(default=0)
-    num_store_stats: int = Field(default=0)
+    log_size: int = 0
+    ondisk_log_size: int = 0
+    up: int = 0
+    acting: int = 0
+    num_store_stats: int = 0
 
 
 class PGStatsDelta(CephBaseModel):
@@ -177,48 +182,48 @@ class PGStatsDelta(CephBaseModel):
 
     stat_sum: PGStatSum
     store_stats: PGStoreStats | None = None
-    log_size: int = Field(default=0)
-    ondisk_log_size: int = Field(default=0)
-    up: int = Field(default=0)
-    acting: int = Field(default=0)
-    num_store_stats: int = Field(default=0)
-    stamp_delta: str = Field(default="")
+    log_size: int = 0
+    ondisk_log_size: int = 0
+    up: int = 0
+    acting: int = 0
+    num_store_stats: int = 0
+    stamp_delta: str = ""
 
 
 class PGStat(CephBaseModel):
     """Schema for individual PG statistics."""
 
-    pgid: str = Field(default="")
-    version: str = Field(default="")
-    reported_seq: int = Field(default=0)
-    reported_epoch: int = Field(default=0)
-    state: str = Field(default="")
-    last_fresh: str = Field(default="")
-    last_change: str = Field(default="")
-    last_active: str = Field(default="")
-    last_peered: str = Field(default="")
-    last_clean: str = Field(default="")
-    last_became_active: str = Field(default="")
-    last_became_peered: str = Field(default="")
-    last_unstale: str = Field(default="")
-    last_undegraded: str = Field(default="")
-    last_fullsized: str = Field(default="")
-    mapping_epoch: int = Field(default=0)
-    log_start: str = Field(default="")
-    ondisk_log_start: str = Field(default="")
-    created: int = Field(default=0)
-    last_epoch_clean: int = Field(default=0)
-    parent: str = Field(default="")
-    parent_split_bits: int = Field(default=0)
-    last_scrub: str = Field(default="")
-    last_scrub_stamp: str = Field(default="")
-    last_deep_scrub: str = Field(default="")
-    last_deep_scrub_stamp: str = Field(default="")
-    last_clean_scrub_stamp: str = Field(default="")
-    objects_scrubbed: int = Field(default=0)
-    log_size: int = Field(default=0)
-    log_dups_size: int = Field(default=0)
-    ondisk_log_size: int = Field(default=0)
+    pgid: str = ""
+    version: str = ""
+    reported_seq: int = 0
+    reported_epoch: int = 0
+    state: str = ""
+    last_fresh: str = ""
+    last_change: str = ""
+    last_active: str = ""
+    last_peered: str = ""
+    last_clean: str = ""
+    last_became_active: str = ""
+    last_became_peered: str = ""
+    last_unstale: str = ""
+    last_undegraded: str = ""
+    last_fullsized: str = ""
+    mapping_epoch: int = 0
+    log_start: str = ""
+    ondisk_log_start: str = ""
+    created: int = 0
+    last_epoch_clean: int = 0
+    parent: str = ""
+    parent_split_bits: int = 0
+    last_scrub: str = ""
+    last_scrub_stamp: str = ""
+    last_deep_scrub: str = ""
+    last_deep_scrub_stamp: str = ""
+    last_clean_scrub_stamp: str = ""
+    objects_scrubbed: int = 0
+    log_size: int = 0
+    log_dups_size: int = 0
+    ondisk_log_size: int = 0
     stats_invalid: bool
     dirty_stats_invalid: bool
     omap_stats_invalid: bool
@@ -226,72 +231,71 @@ class PGStat(CephBaseModel):
     hitset_bytes_stats_invalid: bool
     pin_stats_invalid: bool
     manifest_stats_invalid: bool
-    snaptrimq_len: int = Field(default=0)
-    last_scrub_duration: int = Field(default=0)
-    scrub_schedule: str = Field(default="")
-    scrub_duration: float = Field(default=0.0)
-    objects_trimmed: int = Field(default=0)
-    snaptrim_duration: float = Field(default=0)
+    snaptrimq_len: int = 0
+    last_scrub_duration: int = 0
+    scrub_schedule: str = ""
+    scrub_duration: float = 0.0
+    objects_trimmed: int = 0
+    snaptrim_duration: float = 0
     stat_sum: PGStatSum
     up: list[int]
     acting: list[int]
-    avail_no_missing: list[Any] = Field(default_factory=list)
-    object_location_counts: list[Any] = Field(default_factory=list)
-    blocked_by: list[Any] = Field(default_factory=list)
-    up_primary: int = Field(default=0)
-    acting_primary: int = Field(default=0)
-    purged_snaps: list[Any] = Field(default_factory=list)
+    # Opaque lists are kept as parsed instead of being copied by validation
+    avail_no_missing: SkipValidation[list[Any]] = Field(default_factory=list)
+    object_location_counts: SkipValidation[list[Any]] = Field(default_factory=list)
+    blocked_by: SkipValidation[list[Any]] = Field(default_factory=list)
+    up_primary: int = 0
+    acting_primary: int = 0
+    purged_snaps: SkipValidation[list[Any]] = Field(default_factory=list)
 
 
 class OSDStat(CephBaseModel):
     """Schema for individual OSD statistics."""
 
-    osd: int = Field(default=0)
-    up_from: int = Field(default=0)
-    seq: int = Field(default=0)
-    num_pgs: int = Field(default=0)
-    num_osds: int = Field(
-        default=1
-    )  # this appears to always be 1 for individual OSD stats
-    num_per_pool_osds: int = Field(default=0)
-    num_per_pool_omap_osds: int = Field(default=0)
-    kb: int = Field(default=0)
-    kb_used: int = Field(default=0)
-    kb_used_data: int = Field(default=0)
-    kb_used_omap: int = Field(default=0)
-    kb_used_meta: int = Field(default=0)
-    kb_avail: int = Field(default=0)
+    osd: int = 0
+    up_from: int = 0
+    seq: int = 0
+    num_pgs: int = 0
+    num_osds: int = 1  # this appears to always be 1 for individual OSD stats
+    num_per_pool_osds: int = 0
+    num_per_pool_omap_osds: int = 0
+    kb: int = 0
+    kb_used: int = 0
+    kb_used_data: int = 0
+    kb_used_omap: int = 0
+    kb_used_meta: int = 0
+    kb_avail: int = 0
     statfs: dict[str, int] = Field(default_factory=dict)
     hb_peers: list[int] = Field(default_factory=list)
-    snap_trim_queue_len: int = Field(default=0)
-    num_snap_trimming: int = Field(default=0)
-    num_shards_repaired: int = Field(default=0)
+    snap_trim_queue_len: int = 0
+    num_snap_trimming: int = 0
+    num_shards_repaired: int = 0
     op_queue_age_hist: OpQueueAgeHist | None = None
     perf_stat: PerfStat | None = None
-    alerts: list[Any] = Field(default_factory=list)
-    network_ping_times: list[Any] = Field(default_factory=list)
+    alerts: SkipValidation[list[Any]] = Field(default_factory=list)
+    network_ping_times: SkipValidation[list[Any]] = Field(default_factory=list)
 
 
 class OSDStatsSum(CephBaseModel):
     """Schema for aggregated OSD statistics summary."""
 
-    up_from: int = Field(default=0)
-    seq: int = Field(default=0)
-    num_pgs: int = Field(default=0)
-    num_osds: int = Field(default=0)
-    num_per_pool_osds: int = Field(default=0)
-    num_per_pool_omap_osds: int = Field(default=0)
-    kb: int = Field(default=0)
-    kb_used: int = Field(default=0)
-    kb_used_data: int = Field(default=0)
-    kb_used_omap: int = Field(default=0)
-    kb_used_meta: int = Field(default=0)
-    kb_avail: int = Field(default=0)
+    up_from: int = 0
+    seq: int = 0
+    num_pgs: int = 0
+    num_osds: int = 0
+    num_per_pool_osds: int = 0
+    num_per_pool_omap_osds: int = 0
+    kb: int = 0
+    kb_used: int = 0
+    kb_used_data: int = 0
+    kb_used_omap: int = 0
+    kb_used_meta: int = 0
+    kb_avail: int = 0
     statfs: dict[str, int] = Field(default_factory=dict)
     hb_peers: list[int] = Field(default_factory=list)
-    snap_trim_queue_len: int = Field(default=0)
-    num_snap_trimming: int = Field(default=0)
-    num_shards_repaired: int = Field(default=0)
+    snap_trim_queue_len: int = 0
+    num_snap_trimming: int = 0
+    num_shards_repaired: int = 0
     op_queue_age_hist: OpQueueAgeHist | None = None
     perf_stat: PerfStat | None = None
     alerts: list[Any] = Field(default_factory=list)
@@ -301,41 +305,41 @@ class OSDStatsSum(CephBaseModel):
 class PoolStatfs(CephBaseModel):
     """Schema for pool statfs entries."""
 
-    poolid: int = Field(default=0)
-    osd: int = Field(default=0)
-    total: int = Field(default=0)
-    available: int = Field(default=0)
-    internally_reserved: int = Field(default=0)
-    allocated: int = Field(default=0)
-    data_stored: int = Field(default=0)
-    data_compressed: int = Field(default=0)
-    data_compressed_allocated: int = Field(default=0)
-    data_compressed_original: int = Field(default=0)
-    omap_allocated: int = Field(default=0)
-    internal_metadata: int = Field(default=0)
+    poolid: int = 0
+    osd: int = 0
+    total: int = 0
+    available: int = 0
+    internally_reserved: int = 0
+    allocated: int = 0
+    data_stored: int = 0
+    data_compressed: int = 0
+    data_compressed_allocated: int = 0
+    data_compressed_original: int = 0
+    omap_allocated: int = 0
+    internal_metadata: int = 0
 
 
 class PoolStat(CephBaseModel):
     """Schema for pool statistics."""
 
-    poolid: int = Field(default=0)
-    num_pg: int = Field(default=0)
+    poolid: int = 0
+    num_pg: int = 0
     stat_sum: PGStatSum
-    store_stats: PGStoreStats | None = Field(default=None)
-    log_size: int = Field(default=0)
-    ondisk_log_size: int = Field(default=0)
-    up: int = Field(default=0)
-    acting: int = Field(default=0)
-    num_store_stats: int = Field(default=0)
+    store_stats: PGStoreStats | None = None
+    log_size: int = 0
+    ondisk_log_size: int = 0
+    up: int = 0
+    acting: int = 0
+    num_store_stats: int = 0
 
 
 class PGMap(CephBaseModel):
     """Schema for PG map."""
 
-    version: int = Field(default=0)
-    stamp: str = Field(default="")
-    last_osdmap_epoch: int = Field(default=0)
-    last_pg_scan: int = Field(default=0)
+    version: int = 0
+    stamp: str = ""
+    last_osdmap_epoch: int = 0
+    last_pg_scan: int = 0
     pg_stats_sum: PGStatsSum
     osd_stats_sum: OSDStatsSum
     pg_stats_delta: PGStatsDelta
@@ -352,8 +356,8 @@ class PGDump(CephBaseModel):
     pg_map: PGMap
 
     @classmethod
-    def loads(cls, raw: str) -> PGDump:
-        """Parse PG dump from JSON string."""
+    def loads(cls, raw: str | bytes) -> PGDump:
+        """Parse PG dump from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -362,34 +366,66 @@ class PGDump(CephBaseModel):
     @classmethod
     def load(cls, path: pathlib.Path) -> PGDump:
         """Load and parse PG dump from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
+class PGStatLite(BaseModel):
+    """Schema for the id and OSD mapping of a PG, a subset of PGStat."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    pgid: str = ""
+    up: list[int] = Field(default_factory=list)
+    acting: list[int] = Field(default_factory=list)
+
+
+class PGMapLite(BaseModel):
+    """Schema for the PG stats of a PG map, a subset of PGMap."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    pg_stats: list[PGStatLite] = Field(default_factory=list)
+
+
+class PGDumpLite(BaseModel):
+    """Narrow schema for `ceph pg dump --format=json` covering PG placement.
+
+    Unlike the CephBaseModel schemas, unknown fields are dropped rather than
+    kept, so validating a large PG dump only builds the PG ids and their OSD
+    mappings. Use PGDump when the PG statistics are needed.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    pg_map: PGMapLite
+
+
 class OSDDFNode(CephBaseModel):
     """Schema for OSD disk usage node from `ceph osd df --format=json`."""
 
-    id: int = Field(default=0)
-    device_class: str = Field(default="")
-    name: str = Field(default="")
-    type: str = Field(default="")
-    type_id: int = Field(default=0)
-    crush_weight: float = Field(default=0.0)
-    depth: int = Field(default=0)
+    id: int = 0
+    device_class: str = ""
+    name: str = ""
+    type: str = ""
+    type_id: int = 0
+    crush_weight: float = 0.0
+    depth: int = 0
     pool_weights: dict[str, Any] = Field(default_factory=dict)
-    reweight: float = Field(default=0.0)
-    kb: int = Field(default=0)
-    kb_used: int = Field(default=0)
-    kb_used_data: int = Field(default=0)
-    kb_used_omap: int = Field(default=0)
-    kb_used_meta: int = Field(default=0)
-    kb_avail: int = Field(default=0)
-    utilization: float = Field(default=0.0)
-    var: float = Field(default=0.0)
-    pgs: int = Field(default=0)
-    status: str = Field(default="")
+    reweight: float = 0.0
+    kb: int = 0
+    kb_used: int = 0
+    kb_used_data: int = 0
+    kb_used_omap: int = 0
+    kb_used_meta: int = 0
+    kb_avail: int = 0
+    utilization: float = 0.0
+    var: float = 0.0
+    pgs: int = 0
+    status: str = ""
 
 
 class OSDDFResponse(CephBaseModel):
@@ -398,8 +434,8 @@ class OSDDFResponse(CephBaseModel):
     nodes: list[OSDDFNode]
 
     @classmethod
-    def loads(cls, raw: str) -> OSDDFResponse:
-        """Parse OSD DF from JSON string."""
+    def loads(cls, raw: str | bytes) -> OSDDFResponse:
+        """Parse OSD DF from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -408,155 +444,156 @@ class OSDDFResponse(CephBaseModel):
     @classmethod
     def load(cls, path: pathlib.Path) -> OSDDFResponse:
         """Load and parse OSD DF from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
 class LastPGMergeMeta(CephBaseModel):
     """Schema for last PG merge metadata."""
 
-    source_pgid: str = Field(default="")
-    ready_epoch: int = Field(default=0)
-    last_epoch_started: int = Field(default=0)
-    last_epoch_clean: int = Field(default=0)
-    source_version: str = Field(default="")
-    target_version: str = Field(default="")
+    source_pgid: str = ""
+    ready_epoch: int = 0
+    last_epoch_started: int = 0
+    last_epoch_clean: int = 0
+    source_version: str = ""
+    target_version: str = ""
 
 
 class HitSetParams(CephBaseModel):
     """Schema for hit set parameters."""
 
-    type: str = Field(default="")
+    type: str = ""
 
 
 class PoolConfig(CephBaseModel):
     """Schema for pool configuration from osd dump."""
 
-    pool: int = Field(default=0)
-    pool_name: str = Field(default="")
-    create_time: str = Field(default="")
-    flags: int = Field(default=0)
-    flags_names: str = Field(default="")
-    type: int = Field(default=0)
-    size: int = Field(default=0)
-    min_size: int = Field(default=0)
-    crush_rule: int = Field(default=0)
-    peering_crush_bucket_count: int = Field(default=0)
-    peering_crush_bucket_target: int = Field(default=0)
-    peering_crush_bucket_barrier: int = Field(default=0)
-    peering_crush_bucket_mandatory_member: int = Field(default=2147483647)
-    object_hash: int = Field(default=0)
-    pg_autoscale_mode: str = Field(default="")
-    pg_num: int = Field(default=0)
-    pg_placement_num: int = Field(default=0)
-    pg_placement_num_target: int = Field(default=0)
-    pg_num_target: int = Field(default=0)
-    pg_num_pending: int = Field(default=0)
+    pool: int = 0
+    pool_name: str = ""
+    create_time: str = ""
+    flags: int = 0
+    flags_names: str = ""
+    type: int = 0
+    size: int = 0
+    min_size: int = 0
+    crush_rule: int = 0
+    peering_crush_bucket_count: int = 0
+    peering_crush_bucket_target: int = 0
+    peering_crush_bucket_barrier: int = 0
+    peering_crush_bucket_mandatory_member: int = _CRUSH_ITEM_NONE
+    object_hash: int = 0
+    pg_autoscale_mode: str = ""
+    pg_num: int = 0
+    pg_placement_num: int = 0
+    pg_placement_num_target: int = 0
+    pg_num_target: int = 0
+    pg_num_pending: int = 0
     last_pg_merge_meta: LastPGMergeMeta | None = None
-    last_change: str = Field(default="")
-    last_force_op_resend: str = Field(default="")
-    last_force_op_resend_prenautilus: str = Field(default="")
-    last_force_op_resend_preluminous: str = Field(default="")
-    auid: int = Field(default=0)
-    snap_mode: str = Field(default="")
-    snap_seq: int = Field(default=0)
-    snap_epoch: int = Field(default=0)
+    last_change: str = ""
+    last_force_op_resend: str = ""
+    last_force_op_resend_prenautilus: str = ""
+    last_force_op_resend_preluminous: str = ""
+    auid: int = 0
+    snap_mode: str = ""
+    snap_seq: int = 0
+    snap_epoch: int = 0
     pool_snaps: list[Any] = Field(default_factory=list)
-    removed_snaps: str = Field(default="")
-    quota_max_bytes: int = Field(default=0)
-    quota_max_objects: int = Field(default=0)
+    removed_snaps: str = ""
+    quota_max_bytes: int = 0
+    quota_max_objects: int = 0
     tiers: list[Any] = Field(default_factory=list)
-    tier_of: int = Field(default=0)
-    read_tier: int = Field(default=0)
-    write_tier: int = Field(default=0)
-    cache_mode: str = Field(default="")
-    target_max_bytes: int = Field(default=0)
-    target_max_objects: int = Field(default=0)
-    cache_target_dirty_ratio_micro: int = Field(default=0)
-    cache_target_dirty_high_ratio_micro: int = Field(default=0)
-    cache_target_full_ratio_micro: int = Field(default=0)
-    cache_min_flush_age: int = Field(default=0)
-    cache_min_evict_age: int = Field(default=0)
-    erasure_code_profile: str = Field(default="")
+    tier_of: int = 0
+    read_tier: int = 0
+    write_tier: int = 0
+    cache_mode: str = ""
+    target_max_bytes: int = 0
+    target_max_objects: int = 0
+    cache_target_dirty_ratio_micro: int = 0
+    cache_target_dirty_high_ratio_micro: int = 0
+    cache_target_full_ratio_micro: int = 0
+    cache_min_flush_age: int = 0
+    cache_min_evict_age: int = 0
+    erasure_code_profile: str = ""
     hit_set_params: HitSetParams
-    hit_set_period: int = Field(default=0)
-    hit_set_count: int = Field(default=0)
+    hit_set_period: int = 0
+    hit_set_count: int = 0
     # Optional fields - may be present in some Ceph versions
-    hit_set_archive: bool = Field(default=False)
-    min_read_recency_for_promote: int = Field(default=0)
-    min_write_recency_for_promote: int = Field(default=0)
-    fast_read: bool = Field(default=False)
-    hit_set_grade_decay_rate: int = Field(default=0)
-    hit_set_search_last_n: int = Field(default=0)
+    hit_set_archive: bool = False
+    min_read_recency_for_promote: int = 0
+    min_write_recency_for_promote: int = 0
+    fast_read: bool = False
+    hit_set_grade_decay_rate: int = 0
+    hit_set_search_last_n: int = 0
     grade_table: list[Any] = Field(default_factory=list)
-    stripe_width: int = Field(default=0)
-    expected_num_objects: int = Field(default=0)
-    compression_algorithm: str = Field(default="")
-    compression_mode: str = Field(default="")
-    compression_required_ratio: float = Field(default=0.0)
-    compression_max_blob_size: int = Field(default=0)
-    compression_min_blob_size: int = Field(default=0)
-    is_stretch_pool: bool = Field(default=False)
-    stretch_rule_id: int = Field(default=0)
-    pg_autoscale_bias: float = Field(default=1.0)
-    pg_num_min: int = Field(default=0)
-    recovery_priority: int = Field(default=0)
-    recovery_op_priority: int = Field(default=0)
-    scrub_min_interval: int = Field(default=0)
-    scrub_max_interval: int = Field(default=0)
-    deep_scrub_interval: int = Field(default=0)
-    recovery_deletes: bool = Field(default=False)
-    auto_repair: bool = Field(default=False)
-    bulk: bool = Field(default=False)
-    fingerprint_algorithm: str | None = Field(default=None)
-    pg_autoscale_max_growth: float | None = Field(default=None)
-    target_size_bytes: int | None = Field(default=None)
-    target_size_ratio: float | None = Field(default=None)
-    pg_num_max: int | None = Field(default=None)
+    stripe_width: int = 0
+    expected_num_objects: int = 0
+    compression_algorithm: str = ""
+    compression_mode: str = ""
+    compression_required_ratio: float = 0.0
+    compression_max_blob_size: int = 0
+    compression_min_blob_size: int = 0
+    is_stretch_pool: bool = False
+    stretch_rule_id: int = 0
+    pg_autoscale_bias: float = 1.0
+    pg_num_min: int = 0
+    recovery_priority: int = 0
+    recovery_op_priority: int = 0
+    scrub_min_interval: int = 0
+    scrub_max_interval: int = 0
+    deep_scrub_interval: int = 0
+    recovery_deletes: bool = False
+    auto_repair: bool = False
+    bulk: bool = False
+    fingerprint_algorithm: str | None = None
+    pg_autoscale_max_growth: float | None = None
+    target_size_bytes: int | None = None
+    target_size_ratio: float | None = None
+    pg_num_max: int | None = None
     # Additional fields that may be present
-    nodelete: bool = Field(default=False)
-    nopgchange: bool = Field(default=False)
-    nosizechange: bool = Field(default=False)
-    write_fadvise_dontneed: bool = Field(default=False)
-    noscrub: bool = Field(default=False)
-    nodeep_scrub: bool = Field(default=False)
-    use_gmt_hitset: bool = Field(default=False)
-    debug_fake_ec_pool: bool = Field(default=False)
-    debug_pool: bool = Field(default=False)
-    hashpspool: bool = Field(default=False)
-    backfillfull: bool = Field(default=False)
-    selfmanaged_snaps: bool = Field(default=False)
+    nodelete: bool = False
+    nopgchange: bool = False
+    nosizechange: bool = False
+    write_fadvise_dontneed: bool = False
+    noscrub: bool = False
+    nodeep_scrub: bool = False
+    use_gmt_hitset: bool = False
+    debug_fake_ec_pool: bool = False
+    debug_pool: bool = False
+    hashpspool: bool = False
+    backfillfull: bool = False
+    selfmanaged_snaps: bool = False
     pool_metadata: dict[str, Any] = Field(default_factory=dict)
-    read_balance_score: int = Field(default=0)
-    pg_autoscale_max_objects: int = Field(default=0)
+    read_balance_score: int = 0
+    pg_autoscale_max_objects: int = 0
     application_metadata: dict[str, Any] = Field(default_factory=dict)
 
 
 class OSDDumpResponse(CephBaseModel):
     """Schema for `ceph osd dump --format=json` response."""
 
-    epoch: int = Field(default=0)
-    fsid: str = Field(default="")
-    created: str = Field(default="")
-    modified: str = Field(default="")
-    last_up_change: str = Field(default="")
-    last_in_change: str = Field(default="")
-    flags: str = Field(default="")
-    flags_num: int = Field(default=0)
+    epoch: int = 0
+    fsid: str = ""
+    created: str = ""
+    modified: str = ""
+    last_up_change: str = ""
+    last_in_change: str = ""
+    flags: str = ""
+    flags_num: int = 0
     flags_set: list[str] = Field(default_factory=list)
-    crush_version: int = Field(default=0)
-    full_ratio: float = Field(default=0.0)
-    backfillfull_ratio: float = Field(default=0.0)
-    nearfull_ratio: float = Field(default=0.0)
-    cluster_snapshot: str = Field(default="")
-    pool_max: int = Field(default=0)
-    max_osd: int = Field(default=0)
-    require_min_compat_client: str = Field(default="")
-    min_compat_client: str = Field(default="")
-    require_osd_release: str = Field(default="")
-    allow_crimson: bool = Field(default=False)
+    crush_version: int = 0
+    full_ratio: float = 0.0
+    backfillfull_ratio: float = 0.0
+    nearfull_ratio: float = 0.0
+    cluster_snapshot: str = ""
+    pool_max: int = 0
+    max_osd: int = 0
+    require_min_compat_client: str = ""
+    min_compat_client: str = ""
+    require_osd_release: str = ""
+    allow_crimson: bool = False
     pools: list[PoolConfig] = Field(default_factory=list)
     osds: list[dict[str, Any]] = Field(default_factory=list)
     pg_upmap: list[Any] = Field(default_factory=list)
@@ -573,8 +610,8 @@ class OSDDumpResponse(CephBaseModel):
     stretch_mode: dict[str, Any] = Field(default_factory=dict)
 
     @classmethod
-    def loads(cls, raw: str) -> OSDDumpResponse:
-        """Parse OSD dump from JSON string."""
+    def loads(cls, raw: str | bytes) -> OSDDumpResponse:
+        """Parse OSD dump from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -583,116 +620,117 @@ class OSDDumpResponse(CephBaseModel):
     @classmethod
     def load(cls, path: pathlib.Path) -> OSDDumpResponse:
         """Load and parse OSD dump from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
 class LatencyHistogram(CephBaseModel):
     """Schema for latency histogram with count, sum and average time."""
 
-    avgcount: int = Field(default=0)
-    sum: float = Field(default=0.0)
-    avgtime: float = Field(default=0.0)
+    avgcount: int = 0
+    sum: float = 0.0
+    avgtime: float = 0.0
 
 
 class AsyncMessengerWorker(CephBaseModel):
     """Schema for AsyncMessenger worker performance metrics."""
 
-    msgr_recv_messages: int = Field(default=0)
-    msgr_send_messages: int = Field(default=0)
-    msgr_recv_bytes: int = Field(default=0)
-    msgr_send_bytes: int = Field(default=0)
-    msgr_created_connections: int = Field(default=0)
-    msgr_active_connections: int = Field(default=0)
-    msgr_running_total_time: float = Field(default=0.0)
-    msgr_running_send_time: float = Field(default=0.0)
-    msgr_running_recv_time: float = Field(default=0.0)
-    msgr_running_fast_dispatch_time: float = Field(default=0.0)
+    msgr_recv_messages: int = 0
+    msgr_send_messages: int = 0
+    msgr_recv_bytes: int = 0
+    msgr_send_bytes: int = 0
+    msgr_created_connections: int = 0
+    msgr_active_connections: int = 0
+    msgr_running_total_time: float = 0.0
+    msgr_running_send_time: float = 0.0
+    msgr_running_recv_time: float = 0.0
+    msgr_running_fast_dispatch_time: float = 0.0
     msgr_send_messages_queue_lat: LatencyHistogram = Field(
         default_factory=LatencyHistogram
     )
     msgr_handle_ack_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    msgr_recv_encrypted_bytes: int = Field(default=0)
-    msgr_send_encrypted_bytes: int = Field(default=0)
+    msgr_recv_encrypted_bytes: int = 0
+    msgr_send_encrypted_bytes: int = 0
 
 
 class BlueFS(CephBaseModel):
     """Schema for BlueFS performance metrics."""
 
-    db_total_bytes: int = Field(default=0)
-    db_used_bytes: int = Field(default=0)
-    wal_total_bytes: int = Field(default=0)
-    wal_used_bytes: int = Field(default=0)
-    slow_total_bytes: int = Field(default=0)
-    slow_used_bytes: int = Field(default=0)
-    num_files: int = Field(default=0)
-    log_bytes: int = Field(default=0)
-    log_compactions: int = Field(default=0)
-    log_write_count: int = Field(default=0)
-    logged_bytes: int = Field(default=0)
-    files_written_wal: int = Field(default=0)
-    files_written_sst: int = Field(default=0)
-    write_count_wal: int = Field(default=0)
-    write_count_sst: int = Field(default=0)
-    bytes_written_wal: int = Field(default=0)
-    bytes_written_sst: int = Field(default=0)
-    bytes_written_slow: int = Field(default=0)
-    max_bytes_wal: int = Field(default=0)
-    max_bytes_db: int = Field(default=0)
-    max_bytes_slow: int = Field(default=0)
-    alloc_unit_slow: int = Field(default=0)
-    alloc_unit_db: int = Field(default=0)
-    alloc_unit_wal: int = Field(default=0)
+    db_total_bytes: int = 0
+    db_used_bytes: int = 0
+    wal_total_bytes: int = 0
+    wal_used_bytes: int = 0
+    slow_total_bytes: int = 0
+    slow_used_bytes: int = 0
+    num_files: int = 0
+    log_bytes: int = 0
+    log_compactions: int = 0
+    log_write_count: int = 0
+    logged_bytes: int = 0
+    files_written_wal: int = 0
+    files_written_sst: int = 0
+    write_count_wal: int = 0
+    write_count_sst: int = 0
+    bytes_written_wal: int = 0
+    bytes_written_sst: int = 0
+    bytes_written_slow: int = 0
+    max_bytes_wal: int = 0
+    max_bytes_db: int = 0
+    max_bytes_slow: int = 0
+    alloc_unit_slow: int = 0
+    alloc_unit_db: int = 0
+    alloc_unit_wal: int = 0
     read_random_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    read_random_count: int = Field(default=0)
-    read_random_bytes: int = Field(default=0)
-    read_random_disk_count: int = Field(default=0)
-    read_random_disk_bytes: int = Field(default=0)
-    read_random_disk_bytes_wal: int = Field(default=0)
-    read_random_disk_bytes_db: int = Field(default=0)
-    read_random_disk_bytes_slow: int = Field(default=0)
-    read_random_buffer_count: int = Field(default=0)
-    read_random_buffer_bytes: int = Field(default=0)
+    read_random_count: int = 0
+    read_random_bytes: int = 0
+    read_random_disk_count: int = 0
+    read_random_disk_bytes: int = 0
+    read_random_disk_bytes_wal: int = 0
+    read_random_disk_bytes_db: int = 0
+    read_random_disk_bytes_slow: int = 0
+    read_random_buffer_count: int = 0
+    read_random_buffer_bytes: int = 0
     read_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    read_count: int = Field(default=0)
-    read_bytes: int = Field(default=0)
-    read_disk_count: int = Field(default=0)
-    read_disk_bytes: int = Field(default=0)
-    read_disk_bytes_wal: int = Field(default=0)
-    read_disk_bytes_db: int = Field(default=0)
-    read_disk_bytes_slow: int = Field(default=0)
-    read_prefetch_count: int = Field(default=0)
-    read_prefetch_bytes: int = Field(default=0)
-    write_count: int = Field(default=0)
-    write_disk_count: int = Field(default=0)
-    write_bytes: int = Field(default=0)
+    read_count: int = 0
+    read_bytes: int = 0
+    read_disk_count: int = 0
+    read_disk_bytes: int = 0
+    read_disk_bytes_wal: int = 0
+    read_disk_bytes_db: int = 0
+    read_disk_bytes_slow: int = 0
+    read_prefetch_count: int = 0
+    read_prefetch_bytes: int = 0
+    write_count: int = 0
+    write_disk_count: int = 0
+    write_bytes: int = 0
     compact_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     compact_lock_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     fsync_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     flush_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     unlink_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     truncate_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    alloc_slow_fallback: int = Field(default=0)
-    alloc_slow_size_fallback: int = Field(default=0)
-    read_zeros_candidate: int = Field(default=0)
-    read_zeros_errors: int = Field(default=0)
+    alloc_slow_fallback: int = 0
+    alloc_slow_size_fallback: int = 0
+    read_zeros_candidate: int = 0
+    read_zeros_errors: int = 0
     wal_alloc_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     db_alloc_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     slow_alloc_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    alloc_wal_max_lat: float = Field(default=0.0)
-    alloc_db_max_lat: float = Field(default=0.0)
-    alloc_slow_max_lat: float = Field(default=0.0)
+    alloc_wal_max_lat: float = 0.0
+    alloc_db_max_lat: float = 0.0
+    alloc_slow_max_lat: float = 0.0
 
 
 class BlueStore(CephBaseModel):
     """Schema for BlueStore performance metrics."""
 
-    allocated: int = Field(default=0)
-    stored: int = Field(default=0)
-    fragmentation_micros: int = Field(default=0)
-    alloc_unit: int = Field(default=0)
+    allocated: int = 0
+    stored: int = 0
+    fragmentation_micros: int = 0
+    alloc_unit: int = 0
     state_prepare_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     state_aio_wait_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     state_io_done_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
@@ -713,62 +751,62 @@ class BlueStore(CephBaseModel):
     txc_commit_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     txc_throttle_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     txc_submit_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    txc_count: int = Field(default=0)
+    txc_count: int = 0
     read_onode_meta_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     read_wait_aio_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     csum_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    read_eio: int = Field(default=0)
-    reads_with_retries: int = Field(default=0)
+    read_eio: int = 0
+    reads_with_retries: int = 0
     read_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     kv_flush_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     kv_commit_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     kv_sync_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     kv_final_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    write_big: int = Field(default=0)
-    write_big_bytes: int = Field(default=0)
-    write_big_blobs: int = Field(default=0)
-    write_big_deferred: int = Field(default=0)
-    write_small: int = Field(default=0)
-    write_small_bytes: int = Field(default=0)
-    write_small_unused: int = Field(default=0)
-    write_small_pre_read: int = Field(default=0)
-    write_pad_bytes: int = Field(default=0)
-    write_penalty_read_ops: int = Field(default=0)
-    write_new: int = Field(default=0)
-    issued_deferred_writes: int = Field(default=0)
-    issued_deferred_write_bytes: int = Field(default=0)
-    submitted_deferred_writes: int = Field(default=0)
-    submitted_deferred_write_bytes: int = Field(default=0)
-    write_big_skipped_blobs: int = Field(default=0)
-    write_big_skipped_bytes: int = Field(default=0)
-    write_small_skipped: int = Field(default=0)
-    write_small_skipped_bytes: int = Field(default=0)
-    compressed: int = Field(default=0)
-    compressed_allocated: int = Field(default=0)
-    compressed_original: int = Field(default=0)
+    write_big: int = 0
+    write_big_bytes: int = 0
+    write_big_blobs: int = 0
+    write_big_deferred: int = 0
+    write_small: int = 0
+    write_small_bytes: int = 0
+    write_small_unused: int = 0
+    write_small_pre_read: int = 0
+    write_pad_bytes: int = 0
+    write_penalty_read_ops: int = 0
+    write_new: int = 0
+    issued_deferred_writes: int = 0
+    issued_deferred_write_bytes: int = 0
+    submitted_deferred_writes: int = 0
+    submitted_deferred_write_bytes: int = 0
+    write_big_skipped_blobs: int = 0
+    write_big_skipped_bytes: int = 0
+    write_small_skipped: int = 0
+    write_small_skipped_bytes: int = 0
+    compressed: int = 0
+    compressed_allocated: int = 0
+    compressed_original: int = 0
     compress_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     decompress_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    compress_success_count: int = Field(default=0)
-    compress_rejected_count: int = Field(default=0)
-    onodes: int = Field(default=0)
-    onodes_pinned: int = Field(default=0)
-    onode_hits: int = Field(default=0)
-    onode_misses: int = Field(default=0)
-    onode_shard_hits: int = Field(default=0)
-    onode_shard_misses: int = Field(default=0)
-    onode_extents: int = Field(default=0)
-    onode_blobs: int = Field(default=0)
-    buffers: int = Field(default=0)
-    buffer_bytes: int = Field(default=0)
-    buffer_hit_bytes: int = Field(default=0)
-    buffer_miss_bytes: int = Field(default=0)
-    onode_reshard: int = Field(default=0)
-    blob_split: int = Field(default=0)
-    extent_compress: int = Field(default=0)
-    gc_merged: int = Field(default=0)
-    omap_iterator_count: int = Field(default=0)
-    omap_rmkeys_count: int = Field(default=0)
-    omap_rmkey_range_count: int = Field(default=0)
+    compress_success_count: int = 0
+    compress_rejected_count: int = 0
+    onodes: int = 0
+    onodes_pinned: int = 0
+    onode_hits: int = 0
+    onode_misses: int = 0
+    onode_shard_hits: int = 0
+    onode_shard_misses: int = 0
+    onode_extents: int = 0
+    onode_blobs: int = 0
+    buffers: int = 0
+    buffer_bytes: int = 0
+    buffer_hit_bytes: int = 0
+    buffer_miss_bytes: int = 0
+    onode_reshard: int = 0
+    blob_split: int = 0
+    extent_compress: int = 0
+    gc_merged: int = 0
+    omap_iterator_count: int = 0
+    omap_rmkeys_count: int = 0
+    omap_rmkey_range_count: int = 0
     omap_seek_to_first_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     omap_upper_bound_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     omap_lower_bound_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
@@ -780,255 +818,255 @@ class BlueStore(CephBaseModel):
     remove_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     truncate_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     allocator_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    slow_aio_wait_count: int = Field(default=0)
-    slow_committed_kv_count: int = Field(default=0)
-    slow_read_onode_meta_count: int = Field(default=0)
-    slow_read_wait_aio_count: int = Field(default=0)
+    slow_aio_wait_count: int = 0
+    slow_committed_kv_count: int = 0
+    slow_read_onode_meta_count: int = 0
+    slow_read_wait_aio_count: int = 0
 
 
 class BlueStorePriCache(CephBaseModel):
     """Schema for BlueStore priority cache metrics."""
 
-    target_bytes: int = Field(default=0)
-    mapped_bytes: int = Field(default=0)
-    unmapped_bytes: int = Field(default=0)
-    heap_bytes: int = Field(default=0)
-    cache_bytes: int = Field(default=0)
+    target_bytes: int = 0
+    mapped_bytes: int = 0
+    unmapped_bytes: int = 0
+    heap_bytes: int = 0
+    cache_bytes: int = 0
 
 
 class BlueStorePriCachePool(CephBaseModel):
     """Schema for BlueStore priority cache pool (data/kv/meta/onode)."""
 
-    pri0_bytes: int = Field(default=0)
-    pri1_bytes: int = Field(default=0)
-    pri2_bytes: int = Field(default=0)
-    pri3_bytes: int = Field(default=0)
-    pri4_bytes: int = Field(default=0)
-    pri5_bytes: int = Field(default=0)
-    pri6_bytes: int = Field(default=0)
-    pri7_bytes: int = Field(default=0)
-    pri8_bytes: int = Field(default=0)
-    pri9_bytes: int = Field(default=0)
-    pri10_bytes: int = Field(default=0)
-    pri11_bytes: int = Field(default=0)
-    reserved_bytes: int = Field(default=0)
-    committed_bytes: int = Field(default=0)
+    pri0_bytes: int = 0
+    pri1_bytes: int = 0
+    pri2_bytes: int = 0
+    pri3_bytes: int = 0
+    pri4_bytes: int = 0
+    pri5_bytes: int = 0
+    pri6_bytes: int = 0
+    pri7_bytes: int = 0
+    pri8_bytes: int = 0
+    pri9_bytes: int = 0
+    pri10_bytes: int = 0
+    pri11_bytes: int = 0
+    reserved_bytes: int = 0
+    committed_bytes: int = 0
 
 
 class CCT(CephBaseModel):
     """Schema for Ceph Context Tracker metrics."""
 
-    total_workers: int = Field(default=0)
-    unhealthy_workers: int = Field(default=0)
+    total_workers: int = 0
+    unhealthy_workers: int = 0
 
 
 class FinisherMetrics(CephBaseModel):
     """Schema for finisher queue metrics."""
 
-    queue_len: int = Field(default=0)
+    queue_len: int = 0
     complete_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
 
 
 class MemPoolMetrics(CephBaseModel):
     """Schema for memory pool metrics."""
 
-    bloom_filter_bytes: int = Field(default=0)
-    bloom_filter_items: int = Field(default=0)
-
-    bluestore_alloc_bytes: int = Field(default=0)
-    bluestore_alloc_items: int = Field(default=0)
-
-    bluestore_cache_data_bytes: int = Field(default=0)
-    bluestore_cache_data_items: int = Field(default=0)
-    bluestore_cache_onode_bytes: int = Field(default=0)
-    bluestore_cache_onode_items: int = Field(default=0)
-    bluestore_cache_meta_bytes: int = Field(default=0)
-    bluestore_cache_meta_items: int = Field(default=0)
-    bluestore_cache_other_bytes: int = Field(default=0)
-    bluestore_cache_other_items: int = Field(default=0)
-    bluestore_cache_buffer_bytes: int = Field(default=0)
-    bluestore_cache_buffer_items: int = Field(default=0)
-
-    bluestore_extent_bytes: int = Field(default=0)
-    bluestore_extent_items: int = Field(default=0)
-    bluestore_blob_bytes: int = Field(default=0)
-    bluestore_blob_items: int = Field(default=0)
-    bluestore_shared_blob_bytes: int = Field(default=0)
-    bluestore_shared_blob_items: int = Field(default=0)
-    bluestore_inline_bl_bytes: int = Field(default=0)
-    bluestore_inline_bl_items: int = Field(default=0)
-    bluestore_fsck_bytes: int = Field(default=0)
-    bluestore_fsck_items: int = Field(default=0)
-    bluestore_txc_bytes: int = Field(default=0)
-    bluestore_txc_items: int = Field(default=0)
-    bluestore_writing_deferred_bytes: int = Field(default=0)
-    bluestore_writing_deferred_items: int = Field(default=0)
-    bluestore_writing_bytes: int = Field(default=0)
-    bluestore_writing_items: int = Field(default=0)
-
-    bluefs_bytes: int = Field(default=0)
-    bluefs_items: int = Field(default=0)
-    bluefs_file_reader_bytes: int = Field(default=0)
-    bluefs_file_reader_items: int = Field(default=0)
-    bluefs_file_writer_bytes: int = Field(default=0)
-    bluefs_file_writer_items: int = Field(default=0)
-
-    buffer_anon_bytes: int = Field(default=0)
-    buffer_anon_items: int = Field(default=0)
-    buffer_meta_bytes: int = Field(default=0)
-    buffer_meta_items: int = Field(default=0)
-
-    osd_bytes: int = Field(default=0)
-    osd_items: int = Field(default=0)
-    osd_mapbl_bytes: int = Field(default=0)
-    osd_mapbl_items: int = Field(default=0)
-    osd_pglog_bytes: int = Field(default=0)
-    osd_pglog_items: int = Field(default=0)
-
-    osdmap_bytes: int = Field(default=0)
-    osdmap_items: int = Field(default=0)
-    osdmap_mapping_bytes: int = Field(default=0)
-    osdmap_mapping_items: int = Field(default=0)
-
-    pgmap_bytes: int = Field(default=0)
-    pgmap_items: int = Field(default=0)
-
-    mds_co_bytes: int = Field(default=0)
-    mds_co_items: int = Field(default=0)
-
-    unittest_1_bytes: int = Field(default=0)
-    unittest_1_items: int = Field(default=0)
-    unittest_2_bytes: int = Field(default=0)
-    unittest_2_items: int = Field(default=0)
+    bloom_filter_bytes: int = 0
+    bloom_filter_items: int = 0
+
+    bluestore_alloc_bytes: int = 0
+    bluestore_alloc_items: int = 0
+
+    bluestore_cache_data_bytes: int = 0
+    bluestore_cache_data_items: int = 0
+    bluestore_cache_onode_bytes: int = 0
+    bluestore_cache_onode_items: int = 0
+    bluestore_cache_meta_bytes: int = 0
+    bluestore_cache_meta_items: int = 0
+    bluestore_cache_other_bytes: int = 0
+    bluestore_cache_other_items: int = 0
+    bluestore_cache_buffer_bytes: int = 0
+    bluestore_cache_buffer_items: int = 0
+
+    bluestore_extent_bytes: int = 0
+    bluestore_extent_items: int = 0
+    bluestore_blob_bytes: int = 0
+    bluestore_blob_items: int = 0
+    bluestore_shared_blob_bytes: int = 0
+    bluestore_shared_blob_items: int = 0
+    bluestore_inline_bl_bytes: int = 0
+    bluestore_inline_bl_items: int = 0
+    bluestore_fsck_bytes: int = 0
+    bluestore_fsck_items: int = 0
+    bluestore_txc_bytes: int = 0
+    bluestore_txc_items: int = 0
+    bluestore_writing_deferred_bytes: int = 0
+    bluestore_writing_deferred_items: int = 0
+    bluestore_writing_bytes: int = 0
+    bluestore_writing_items: int = 0
+
+    bluefs_bytes: int = 0
+    bluefs_items: int = 0
+    bluefs_file_reader_bytes: int = 0
+    bluefs_file_reader_items: int = 0
+    bluefs_file_writer_bytes: int = 0
+    bluefs_file_writer_items: int = 0
+
+    buffer_anon_bytes: int = 0
+    buffer_anon_items: int = 0
+    buffer_meta_bytes: int = 0
+    buffer_meta_items: int = 0
+
+    osd_bytes: int = 0
+    osd_items: int = 0
+    osd_mapbl_bytes: int = 0
+    osd_mapbl_items: int = 0
+    osd_pglog_bytes: int = 0
+    osd_pglog_items: int = 0
+
+    osdmap_bytes: int = 0
+    osdmap_items: int = 0
+    osdmap_mapping_bytes: int = 0
+    osdmap_mapping_items: int = 0
+
+    pgmap_bytes: int = 0
+    pgmap_items: int = 0
+
+    mds_co_bytes: int = 0
+    mds_co_items: int = 0
+
+    unittest_1_bytes: int = 0
+    unittest_1_items: int = 0
+    unittest_2_bytes: int = 0
+    unittest_2_items: int = 0
 
 
 class ObjecterMetrics(CephBaseModel):
     """Schema for Objecter client metrics."""
 
-    op_active: int = Field(default=0)
-    op_laggy: int = Field(default=0)
-    op_send: int = Field(default=0)
-    op_send_bytes: int = Field(default=0)
-    op_resend: int = Field(default=0)
-    op_reply: int = Field(default=0)
+    op_active: int = 0
+    op_laggy: int = 0
+    op_send: int = 0
+    op_send_bytes: int = 0
+    op_resend: int = 0
+    op_reply: int = 0
     op_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    op_inflight: int = Field(default=0)
+    op_inflight: int = 0
     oplen_avg: dict[str, int] = Field(default_factory=dict)
-    op: int = Field(default=0)
-    op_r: int = Field(default=0)
-    op_w: int = Field(default=0)
-    op_rmw: int = Field(default=0)
-    op_pg: int = Field(default=0)
-
-    osdop_stat: int = Field(default=0)
-    osdop_create: int = Field(default=0)
-    osdop_read: int = Field(default=0)
-    osdop_write: int = Field(default=0)
-    osdop_writefull: int = Field(default=0)
-    osdop_writesame: int = Field(default=0)
-    osdop_append: int = Field(default=0)
-    osdop_zero: int = Field(default=0)
-    osdop_truncate: int = Field(default=0)
-    osdop_delete: int = Field(default=0)
-    osdop_mapext: int = Field(default=0)
-    osdop_sparse_read: int = Field(default=0)
-    osdop_clonerange: int = Field(default=0)
-    osdop_getxattr: int = Field(default=0)
-    osdop_setxattr: int = Field(default=0)
-    osdop_cmpxattr: int = Field(default=0)
-    osdop_rmxattr: int = Field(default=0)
-    osdop_resetxattrs: int = Field(default=0)
-    osdop_call: int = Field(default=0)
-    osdop_watch: int = Field(default=0)
-    osdop_notify: int = Field(default=0)
-    osdop_src_cmpxattr: int = Field(default=0)
-    osdop_pgls: int = Field(default=0)
-    osdop_pgls_filter: int = Field(default=0)
-    osdop_other: int = Field(default=0)
-
-    linger_active: int = Field(default=0)
-    linger_send: int = Field(default=0)
-    linger_resend: int = Field(default=0)
-    linger_ping: int = Field(default=0)
-
-    poolop_active: int = Field(default=0)
-    poolop_send: int = Field(default=0)
-    poolop_resend: int = Field(default=0)
-    poolstat_active: int = Field(default=0)
-    poolstat_send: int = Field(default=0)
-    poolstat_resend: int = Field(default=0)
-    statfs_active: int = Field(default=0)
-    statfs_send: int = Field(default=0)
-    statfs_resend: int = Field(default=0)
-    command_active: int = Field(default=0)
-    command_send: int = Field(default=0)
-    command_resend: int = Field(default=0)
-
-    map_epoch: int = Field(default=0)
-    map_full: int = Field(default=0)
-    map_inc: int = Field(default=0)
-    osd_sessions: int = Field(default=0)
-    osd_session_open: int = Field(default=0)
-    osd_session_close: int = Field(default=0)
-    osd_laggy: int = Field(default=0)
-
-    omap_wr: int = Field(default=0)
-    omap_rd: int = Field(default=0)
-    omap_del: int = Field(default=0)
+    op: int = 0
+    op_r: int = 0
+    op_w: int = 0
+    op_rmw: int = 0
+    op_pg: int = 0
+
+    osdop_stat: int = 0
+    osdop_create: int = 0
+    osdop_read: int = 0
+    osdop_write: int = 0
+    osdop_writefull: int = 0
+    osdop_writesame: int = 0
+    osdop_append: int = 0
+    osdop_zero: int = 0
+    osdop_truncate: int = 0
+    osdop_delete: int = 0
+    osdop_mapext: int = 0
+    osdop_sparse_read: int = 0
+    osdop_clonerange: int = 0
+    osdop_getxattr: int = 0
+    osdop_setxattr: int = 0
+    osdop_cmpxattr: int = 0
+    osdop_rmxattr: int = 0
+    osdop_resetxattrs: int = 0
+    osdop_call: int = 0
+    osdop_watch: int = 0
+    osdop_notify: int = 0
+    osdop_src_cmpxattr: int = 0
+    osdop_pgls: int = 0
+    osdop_pgls_filter: int = 0
+    osdop_other: int = 0
+
+    linger_active: int = 0
+    linger_send: int = 0
+    linger_resend: int = 0
+    linger_ping: int = 0
+
+    poolop_active: int = 0
+    poolop_send: int = 0
+    poolop_resend: int = 0
+    poolstat_active: int = 0
+    poolstat_send: int = 0
+    poolstat_resend: int = 0
+    statfs_active: int = 0
+    statfs_send: int = 0
+    statfs_resend: int = 0
+    command_active: int = 0
+    command_send: int = 0
+    command_resend: int = 0
+
+    map_epoch: int = 0
+    map_full: int = 0
+    map_inc: int = 0
+    osd_sessions: int = 0
+    osd_session_open: int = 0
+    osd_session_close: int = 0
+    osd_laggy: int = 0
+
+    omap_wr: int = 0
+    omap_rd: int = 0
+    omap_del: int = 0
 
 
 class OSDMetrics(CephBaseModel):
     """Schema for OSD daemon performance metrics."""
 
-    op_wip: int = Field(default=0)
-    op: int = Field(default=0)
-    op_in_bytes: int = Field(default=0)
-    op_out_bytes: int = Field(default=0)
+    op_wip: int = 0
+    op: int = 0
+    op_in_bytes: int = 0
+    op_out_bytes: int = 0
     op_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
     op_process_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
     op_prepare_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
 
-    op_r: int = Field(default=0)
-    op_r_out_bytes: int = Field(default=0)
+    op_r: int = 0
+    op_r_out_bytes: int = 0
     op_r_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
     op_r_process_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
     op_r_prepare_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
 
-    op_w: int = Field(default=0)
-    op_w_in_bytes: int = Field(default=0)
+    op_w: int = 0
+    op_w_in_bytes: int = 0
     op_w_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
     op_w_process_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
     op_w_prepare_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
 
-    op_rw: int = Field(default=0)
-    op_rw_in_bytes: int = Field(default=0)
-    op_rw_out_bytes: int = Field(default=0)
+    op_rw: int = 0
+    op_rw_in_bytes: int = 0
+    op_rw_out_bytes: int = 0
     op_rw_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
     op_rw_process_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
     op_rw_prepare_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
 
-    op_delayed_unreadable: int = Field(default=0)
-    op_delayed_degraded: int = Field(default=0)
+    op_delayed_unreadable: int = 0
+    op_delayed_degraded: int = 0
     op_before_queue_op_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     op_before_dequeue_op_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
 
-    subop: int = Field(default=0)
-    subop_in_bytes: int = Field(default=0)
+    subop: int = 0
+    subop_in_bytes: int = 0
     subop_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    subop_w: int = Field(default=0)
-    subop_w_in_bytes: int = Field(default=0)
+    subop_w: int = 0
+    subop_w_in_bytes: int = 0
     subop_w_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    subop_pull: int = Field(default=0)
+    subop_pull: int = 0
     subop_pull_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    subop_push: int = Field(default=0)
-    subop_push_in_bytes: int = Field(default=0)
+    subop_push: int = 0
+    subop_push_in_bytes: int = 0
     subop_push_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
 
-    pull: int = Field(default=0)
-    push: int = Field(default=0)
-    push_out_bytes: int = Field(default=0)
-    recovery_ops: int = Field(default=0)
-    recovery_bytes: int = Field(default=0)
+    pull: int = 0
+    push: int = 0
+    push_out_bytes: int = 0
+    recovery_ops: int = 0
+    recovery_bytes: int = 0
     l_osd_recovery_push_queue_latency: LatencyHistogram = Field(
         default_factory=LatencyHistogram
     )
@@ -1054,70 +1092,70 @@ class OSDMetrics(CephBaseModel):
         default_factory=LatencyHistogram
     )
 
-    loadavg: int = Field(default=0)
-    cached_crc: int = Field(default=0)
-    cached_crc_adjusted: int = Field(default=0)
-    missed_crc: int = Field(default=0)
-
-    numpg: int = Field(default=0)
-    numpg_primary: int = Field(default=0)
-    numpg_replica: int = Field(default=0)
-    numpg_stray: int = Field(default=0)
-    numpg_removing: int = Field(default=0)
-
-    heartbeat_to_peers: int = Field(default=0)
-    map_messages: int = Field(default=0)
-    map_message_epochs: int = Field(default=0)
-    map_message_epoch_dups: int = Field(default=0)
-    messages_delayed_for_map: int = Field(default=0)
-    osd_map_cache_hit: int = Field(default=0)
-    osd_map_cache_miss: int = Field(default=0)
-    osd_map_cache_miss_low: int = Field(default=0)
+    loadavg: int = 0
+    cached_crc: int = 0
+    cached_crc_adjusted: int = 0
+    missed_crc: int = 0
+
+    numpg: int = 0
+    numpg_primary: int = 0
+    numpg_replica: int = 0
+    numpg_stray: int = 0
+    numpg_removing: int = 0
+
+    heartbeat_to_peers: int = 0
+    map_messages: int = 0
+    map_message_epochs: int = 0
+    map_message_epoch_dups: int = 0
+    messages_delayed_for_map: int = 0
+    osd_map_cache_hit: int = 0
+    osd_map_cache_miss: int = 0
+    osd_map_cache_miss_low: int = 0
     osd_map_cache_miss_low_avg: dict[str, int] = Field(
         default_factory=dict
     )  # avgcount, sum
-    osd_map_bl_cache_hit: int = Field(default=0)
-    osd_map_bl_cache_miss: int = Field(default=0)
-
-    stat_bytes: int = Field(default=0)
-    stat_bytes_used: int = Field(default=0)
-    stat_bytes_avail: int = Field(default=0)
-
-    copyfrom: int = Field(default=0)
-    tier_promote: int = Field(default=0)
-    tier_flush: int = Field(default=0)
-    tier_flush_fail: int = Field(default=0)
-    tier_try_flush: int = Field(default=0)
-    tier_try_flush_fail: int = Field(default=0)
-    tier_evict: int = Field(default=0)
-    tier_whiteout: int = Field(default=0)
-    tier_dirty: int = Field(default=0)
-    tier_clean: int = Field(default=0)
-    tier_delay: int = Field(default=0)
-    tier_proxy_read: int = Field(default=0)
-    tier_proxy_write: int = Field(default=0)
-    agent_wake: int = Field(default=0)
-    agent_skip: int = Field(default=0)
-    agent_flush: int = Field(default=0)
-    agent_evict: int = Field(default=0)
-
-    object_ctx_cache_hit: int = Field(default=0)
-    object_ctx_cache_total: int = Field(default=0)
-    op_cache_hit: int = Field(default=0)
+    osd_map_bl_cache_hit: int = 0
+    osd_map_bl_cache_miss: int = 0
+
+    stat_bytes: int = 0
+    stat_bytes_used: int = 0
+    stat_bytes_avail: int = 0
+
+    copyfrom: int = 0
+    tier_promote: int = 0
+    tier_flush: int = 0
+    tier_flush_fail: int = 0
+    tier_try_flush: int = 0
+    tier_try_flush_fail: int = 0
+    tier_evict: int = 0
+    tier_whiteout: int = 0
+    tier_dirty: int = 0
+    tier_clean: int = 0
+    tier_delay: int = 0
+    tier_proxy_read: int = 0
+    tier_proxy_write: int = 0
+    agent_wake: int = 0
+    agent_skip: int = 0
+    agent_flush: int = 0
+    agent_evict: int = 0
+
+    object_ctx_cache_hit: int = 0
+    object_ctx_cache_total: int = 0
+    op_cache_hit: int = 0
 
     osd_tier_flush_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     osd_tier_promote_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
     osd_tier_r_lat: LatencyHistogram = Field(default_factory=LatencyHistogram)
 
-    osd_pg_info: int = Field(default=0)
-    osd_pg_fastinfo: int = Field(default=0)
-    osd_pg_biginfo: int = Field(default=0)
+    osd_pg_info: int = 0
+    osd_pg_fastinfo: int = 0
+    osd_pg_biginfo: int = 0
 
 
 class OSDSlowOps(CephBaseModel):
     """Schema for OSD slow operations metrics."""
 
-    slow_ops_count: int = Field(default=0)
+    slow_ops_count: int = 0
 
 
 class RecoveryStatePerf(CephBaseModel):
@@ -1174,13 +1212,13 @@ class RocksDBMetrics(CephBaseModel):
     get_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
     submit_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
     submit_sync_latency: LatencyHistogram = Field(default_factory=LatencyHistogram)
-    compact: int = Field(default=0)
-    compact_running: int = Field(default=0)
-    compact_completed: int = Field(default=0)
-    compact_lasted: float = Field(default=0.0)
-    compact_range: int = Field(default=0)
-    compact_queue_merge: int = Field(default=0)
-    compact_queue_len: int = Field(default=0)
+    compact: int = 0
+    compact_running: int = 0
+    compact_completed: int = 0
+    compact_lasted: float = 0.0
+    compact_range: int = 0
+    compact_queue_merge: int = 0
+    compact_queue_len: int = 0
     rocksdb_write_wal_time: LatencyHistogram = Field(default_factory=LatencyHistogram)
     rocksdb_write_memtable_time: LatencyHistogram = Field(
         default_factory=LatencyHistogram
@@ -1194,17 +1232,17 @@ class RocksDBMetrics(CephBaseModel):
 class ThrottleMetrics(CephBaseModel):
     """Schema for throttling metrics."""
 
-    val: int = Field(default=0)
-    max: int = Field(default=0)
-    get_started: int = Field(default=0)
-    get: int = Field(default=0)
-    get_sum: int = Field(default=0)
-    get_or_fail_fail: int = Field(default=0)
-    get_or_fail_success: int = Field(default=0)
-    take: int = Field(default=0)
-    take_sum: int = Field(default=0)
-    put: int = Field(default=0)
-    put_sum: int = Field(default=0)
+    val: int = 0
+    max: int = 0
+    get_started: int = 0
+    get: int = 0
+    get_sum: int = 0
+    get_or_fail_fail: int = 0
+    get_or_fail_success: int = 0
+    take: int = 0
+    take_sum: int = 0
+    put: int = 0
+    put_sum: int = 0
     wait: LatencyHistogram = Field(default_factory=LatencyHistogram)
 
 
@@ -1323,8 +1361,8 @@ class OSDPerfDumpResponse(CephBaseModel):
     )
 
     @classmethod
-    def loads(cls, raw: str) -> OSDPerfDumpResponse:
-        """Parse OSD performance dump from JSON string."""
+    def loads(cls, raw: str | bytes) -> OSDPerfDumpResponse:
+        """Parse OSD performance dump from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -1333,37 +1371,38 @@ class OSDPerfDumpResponse(CephBaseModel):
     @classmethod
     def load(cls, path: pathlib.Path) -> OSDPerfDumpResponse:
         """Load and parse OSD performance dump from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
 class CephfsClient(CephBaseModel):
     """Schema for CephFS client information from fs status."""
 
-    clients: int = Field(default=0)
-    fs: str = Field(default="")
+    clients: int = 0
+    fs: str = ""
 
 
 class CephfsMDSVersion(CephBaseModel):
     """Schema for MDS version information from fs status."""
 
     daemon: list[str] = Field(default_factory=list)
-    version: str = Field(default="")
+    version: str = ""
 
 
 class CephfsMDSMapEntry(CephBaseModel):
     """Schema for MDS map entry from fs status."""
 
-    caps: int = Field(default=0)
-    dirs: int = Field(default=0)
-    dns: int = Field(default=0)
-    inos: int = Field(default=0)
-    name: str = Field(default="")
-    rank: int = Field(default=-1)
-    rate: int = Field(default=0)
-    state: str = Field(default="")
+    caps: int = 0
+    dirs: int = 0
+    dns: int = 0
+    inos: int = 0
+    name: str = ""
+    rank: int = -1
+    rate: int = 0
+    state: str = ""
 
     # Optional field for source
     file: Optional[str] = Field(
@@ -1374,11 +1413,11 @@ class CephfsMDSMapEntry(CephBaseModel):
 class CephfsPool(CephBaseModel):
     """Schema for CephFS pool information from fs status."""
 
-    avail: int = Field(default=0)
+    avail: int = 0
     pool_id: int = Field(default=0, alias="id")
-    name: str = Field(default="")
+    name: str = ""
     pool_type: str = Field(default="", alias="type")
-    used: int = Field(default=0)
+    used: int = 0
 
 
 class CephfsStatusResponse(CephBaseModel):
@@ -1390,8 +1429,8 @@ class CephfsStatusResponse(CephBaseModel):
     pools: list[CephfsPool] = Field(default_factory=list)
 
     @classmethod
-    def loads(cls, raw: str) -> CephfsStatusResponse:
-        """Parse CephFS status from JSON string."""
+    def loads(cls, raw: str | bytes) -> CephfsStatusResponse:
+        """Parse CephFS status from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -1400,18 +1439,19 @@ class CephfsStatusResponse(CephBaseModel):
     @classmethod
     def load(cls, path: pathlib.Path) -> CephfsStatusResponse:
         """Load and parse CephFS status from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
 class MDSAddressVector(CephBaseModel):
     """Schema for MDS address vector."""
 
-    type: str = Field(default="")
-    addr: str = Field(default="")
-    nonce: int = Field(default=0)
+    type: str = ""
+    addr: str = ""
+    nonce: int = 0
 
 
 class MDSAddresses(CephBaseModel):
@@ -1431,55 +1471,55 @@ class MDSCompatibility(CephBaseModel):
 class MDSInfo(CephBaseModel):
     """Schema for individual MDS daemon information."""
 
-    gid: int = Field(default=0)
-    name: str = Field(default="")
-    rank: int = Field(default=-1)
-    incarnation: int = Field(default=0)
-    state: str = Field(default="")
-    state_seq: int = Field(default=0)
-    addr: str = Field(default="")
+    gid: int = 0
+    name: str = ""
+    rank: int = -1
+    incarnation: int = 0
+    state: str = ""
+    state_seq: int = 0
+    addr: str = ""
     addrs: MDSAddresses = Field(default_factory=MDSAddresses)
-    join_fscid: int = Field(default=-1)
+    join_fscid: int = -1
     export_targets: list[int] = Field(default_factory=list)
-    features: int = Field(default=0)
-    flags: int = Field(default=0)
+    features: int = 0
+    flags: int = 0
     compat: MDSCompatibility = Field(default_factory=MDSCompatibility)
-    epoch: int = Field(default=0)  # Only present for standbys
+    epoch: int = 0  # Only present for standbys
 
 
 class MDSFlagsState(CephBaseModel):
     """Schema for MDS flags state."""
 
-    joinable: bool = Field(default=True)
-    allow_snaps: bool = Field(default=True)
-    allow_multimds_snaps: bool = Field(default=True)
-    allow_standby_replay: bool = Field(default=False)
-    refuse_client_session: bool = Field(default=False)
-    refuse_standby_for_another_fs: bool = Field(default=False)
-    balance_automate: bool = Field(default=False)
+    joinable: bool = True
+    allow_snaps: bool = True
+    allow_multimds_snaps: bool = True
+    allow_standby_replay: bool = False
+    refuse_client_session: bool = False
+    refuse_standby_for_another_fs: bool = False
+    balance_automate: bool = False
 
 
 class MDSMap(CephBaseModel):
     """Schema for MDS map within a filesystem."""
 
-    epoch: int = Field(default=0)
-    flags: int = Field(default=0)
+    epoch: int = 0
+    flags: int = 0
     flags_state: MDSFlagsState = Field(default_factory=MDSFlagsState)
-    ever_allowed_features: int = Field(default=0)
-    explicitly_allowed_features: int = Field(default=0)
-    created: str = Field(default="")
-    modified: str = Field(default="")
-    tableserver: int = Field(default=0)
-    root: int = Field(default=0)
-    session_timeout: int = Field(default=60)
-    session_autoclose: int = Field(default=300)
+    ever_allowed_features: int = 0
+    explicitly_allowed_features: int = 0
+    created: str = ""
+    modified: str = ""
+    tableserver: int = 0
+    root: int = 0
+    session_timeout: int = 60
+    session_autoclose: int = 300
     required_client_features: dict[str, Any] = Field(default_factory=dict)
-    max_file_size: int = Field(default=0)
-    max_xattr_size: int = Field(default=0)
-    last_failure: int = Field(default=0)
-    last_failure_osd_epoch: int = Field(default=0)
+    max_file_size: int = 0
+    max_xattr_size: int = 0
+    last_failure: int = 0
+    last_failure_osd_epoch: int = 0
     compat: MDSCompatibility = Field(default_factory=MDSCompatibility)
-    max_mds: int = Field(default=1)
+    max_mds: int = 1
     # "in" is a Python keyword
     in_ranks: list[int] = Field(default_factory=list, alias="in")
     up: dict[str, int] = Field(default_factory=dict)
@@ -1488,12 +1528,12 @@ class MDSMap(CephBaseModel):
     stopped: list[int] = Field(default_factory=list)
     info: dict[str, MDSInfo] = Field(default_factory=dict)
     data_pools: list[int] = Field(default_factory=list)
-    metadata_pool: int = Field(default=0)
-    enabled: bool = Field(default=True)
-    fs_name: str = Field(default="")
-    balancer: str = Field(default="")
-    bal_rank_mask: str = Field(default="")
-    standby_count_wanted: int = Field(default=1)
+    metadata_pool: int = 0
+    enabled: bool = True
+    fs_name: str = ""
+    balancer: str = ""
+    bal_rank_mask: str = ""
+    standby_count_wanted: int = 1
 
 
 class FilesystemInfo(CephBaseModel):
@@ -1514,15 +1554,15 @@ class FSMapCompatibility(CephBaseModel):
 class FSMapFeatureFlags(CephBaseModel):
     """Schema for fsmap feature flags."""
 
-    enable_multiple: bool = Field(default=False)
-    ever_enabled_multiple: bool = Field(default=False)
+    enable_multiple: bool = False
+    ever_enabled_multiple: bool = False
 
 
 class FSMap(CephBaseModel):
     """Schema for the fsmap section of mds stat (detailed MDS map)."""
 
-    epoch: int = Field(default=0)
-    default_fscid: int = Field(default=0)
+    epoch: int = 0
+    default_fscid: int = 0
     compat: FSMapCompatibility = Field(default_factory=FSMapCompatibility)
     feature_flags: FSMapFeatureFlags = Field(default_factory=FSMapFeatureFlags)
     standbys: list[MDSInfo] = Field(default_factory=list)
@@ -1533,8 +1573,8 @@ class CephfsMDSStatResponse(CephBaseModel):
     """Schema for `ceph mds stat --format=json` response."""
 
     fsmap: FSMap = Field(default_factory=FSMap)
-    mdsmap_first_committed: int = Field(default=0)
-    mdsmap_last_committed: int = Field(default=0)
+    mdsmap_first_committed: int = 0
+    mdsmap_last_committed: int = 0
 
     @property
     def standbys(self) -> list[MDSInfo]:
@@ -1547,8 +1587,8 @@ class CephfsMDSStatResponse(CephBaseModel):
         return self.fsmap.filesystems
 
     @classmethod
-    def loads(cls, raw: str) -> CephfsMDSStatResponse:
-        """Parse MDS stat from JSON string."""
+    def loads(cls, raw: str | bytes) -> CephfsMDSStatResponse:
+        """Parse MDS stat from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -1557,9 +1597,10 @@ class CephfsMDSStatResponse(CephBaseModel):
     @classmethod
     def load(cls, path: pathlib.Path) -> CephfsMDSStatResponse:
         """Load and parse MDS stat from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
@@ -1567,15 +1608,15 @@ class CephfsSessionEntityName(CephBaseModel):
     """Schema for CephFS session entity name."""
 
     entity_type: str = Field(default="client", alias="type")
-    num: int = Field(default=0)
+    num: int = 0
 
 
 class CephfsSessionEntityAddr(CephBaseModel):
     """Schema for CephFS session entity address."""
 
     addr_type: str = Field(default="v1", alias="type")
-    addr: str = Field(default="")
-    nonce: int = Field(default=0)
+    addr: str = ""
+    nonce: int = 0
 
 
 class CephfsSessionEntity(CephBaseModel):
@@ -1588,20 +1629,20 @@ class CephfsSessionEntity(CephBaseModel):
 class CephfsSessionMetricValue(CephBaseModel):
     """Schema for CephFS session metric with value and halflife."""
 
-    value: float = Field(default=0.0)
-    halflife: float = Field(default=0.0)
+    value: float = 0.0
+    halflife: float = 0.0
 
 
 class CephfsSessionClientFeatures(CephBaseModel):
     """Schema for CephFS session client features."""
 
-    feature_bits: str = Field(default="0x0")
+    feature_bits: str = "0x0"
 
 
 class CephfsSessionMetricFlags(CephBaseModel):
     """Schema for CephFS session metric flags."""
 
-    feature_bits: str = Field(default="0x0")
+    feature_bits: str = "0x0"
 
 
 class CephfsSessionMetricSpec(CephBaseModel):
@@ -1621,24 +1662,24 @@ class CephfsSessionClientMetadata(CephBaseModel):
     metric_spec: CephfsSessionMetricSpec = Field(
         default_factory=CephfsSessionMetricSpec
     )
-    entity_id: str = Field(default="")
-    hostname: str = Field(default="")
-    kernel_version: str = Field(default="")
-    root: str = Field(default="")
+    entity_id: str = ""
+    hostname: str = ""
+    kernel_version: str = ""
+    root: str = ""
 
 
 class CephfsSessionCompletedRequest(CephBaseModel):
     """Schema for CephFS session completed request."""
 
-    tid: int = Field(default=0)
-    created_ino: str = Field(default="")
+    tid: int = 0
+    created_ino: str = ""
 
 
 class CephfsSessionPreallocIno(CephBaseModel):
     """Schema for CephFS session preallocated inode range."""
 
-    start: str = Field(default="")
-    length: int = Field(default=0)
+    start: str = ""
+    length: int = 0
 
 
 class CephfsSession(CephBaseModel):
@@ -1646,15 +1687,15 @@ class CephfsSession(CephBaseModel):
 
     session_id: int = Field(default=0, alias="id")
     entity: CephfsSessionEntity = Field(default_factory=CephfsSessionEntity)
-    state: str = Field(default="")
-    num_leases: int = Field(default=0)
-    num_caps: int = Field(default=0)
-    request_load_avg: float = Field(default=0.0)
-    uptime: float = Field(default=0.0)
-    requests_in_flight: int = Field(default=0)
-    num_completed_requests: int = Field(default=0)
-    num_completed_flushes: int = Field(default=0)
-    reconnecting: bool = Field(default=False)
+    state: str = ""
+    num_leases: int = 0
+    num_caps: int = 0
+    request_load_avg: float = 0.0
+    uptime: float = 0.0
+    requests_in_flight: int = 0
+    num_completed_requests: int = 0
+    num_completed_flushes: int = 0
+    reconnecting: bool = False
     recall_caps: CephfsSessionMetricValue = Field(
         default_factory=CephfsSessionMetricValue
     )
@@ -1673,10 +1714,10 @@ class CephfsSession(CephBaseModel):
     cap_acquisition: CephfsSessionMetricValue = Field(
         default_factory=CephfsSessionMetricValue
     )
-    last_trim_completed_requests_tid: int = Field(default=0)
-    last_trim_completed_flushes_tid: int = Field(default=0)
+    last_trim_completed_requests_tid: int = 0
+    last_trim_completed_flushes_tid: int = 0
     delegated_inos: list[int] = Field(default_factory=list)
-    inst: str = Field(default="")
+    inst: str = ""
     completed_requests: list[CephfsSessionCompletedRequest] = Field(
         default_factory=list
     )
@@ -1704,8 +1745,8 @@ class CephfsSessionListResponse(RootModel[list[CephfsSession]]):
         return self.root
 
     @classmethod
-    def loads(cls, raw: str) -> CephfsSessionListResponse:
-        """Parse CephFS session list from JSON string."""
+    def loads(cls, raw: str | bytes) -> CephfsSessionListResponse:
+        """Parse CephFS session list from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -1716,38 +1757,39 @@ class CephfsSessionListResponse(RootModel[list[CephfsSession]]):
     @classmethod
     def load(cls, path: pathlib.Path) -> CephfsSessionListResponse:
         """Load and parse CephFS session list from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
 class HealthCheckSummary(CephBaseModel):
     """Schema for health check summary."""
 
-    message: str = Field(default="")
-    count: int = Field(default=0)
+    message: str = ""
+    count: int = 0
 
 
 class HealthCheckDetail(CephBaseModel):
     """Schema for health check detail."""
 
-    message: str = Field(default="")
+    message: str = ""
 
 
 class HealthCheck(CephBaseModel):
     """Schema for individual health check."""
 
-    severity: str = Field(default="")
+    severity: str = ""
     summary: HealthCheckSummary = Field(default_factory=HealthCheckSummary)
     detail: list[HealthCheckDetail] = Field(default_factory=list)
-    muted: bool = Field(default=False)
+    muted: bool = False
 
 
 class Health(CephBaseModel):
     """Schema for cluster health status."""
 
-    status: str = Field(default="")
+    status: str = ""
     checks: dict[str, HealthCheck] = Field(default_factory=dict)
     mutes: list[dict[str, Any]] = Field(default_factory=list)
 
@@ -1762,28 +1804,28 @@ class MonMapFeatures(CephBaseModel):
 class MonInfo(CephBaseModel):
     """Schema for monitor information."""
 
-    rank: int = Field(default=0)
-    name: str = Field(default="")
+    rank: int = 0
+    name: str = ""
     public_addrs: dict[str, Any] = Field(default_factory=dict)
-    public_addr: str = Field(default="")
-    addr: str = Field(default="")
-    priority: int = Field(default=0)
-    weight: int = Field(default=0)
-    crush_location: str = Field(default="")
+    public_addr: str = ""
+    addr: str = ""
+    priority: int = 0
+    weight: int = 0
+    crush_location: str = ""
 
 
 class MonMap(CephBaseModel):
     """Schema for monitor map."""
 
-    epoch: int = Field(default=0)
-    fsid: str = Field(default="")
-    modified: str = Field(default="")
-    created: str = Field(default="")
-    min_mon_release: int = Field(default=0)
-    min_mon_release_name: str = Field(default="")
-    election_strategy: int = Field(default=0)
-    stretch_mode: bool = Field(default=False)
-    tiebreaker_mon: str = Field(default="")
+    epoch: int = 0
+    fsid: str = ""
+    modified: str = ""
+    created: str = ""
+    min_mon_release: int = 0
+    min_mon_release_name: str = ""
+    election_strategy: int = 0
+    stretch_mode: bool = False
+    tiebreaker_mon: str = ""
     disallowed_leaders: str = Field(default="", alias="disallowed_leaders: ")
     features: MonMapFeatures = Field(default_factory=MonMapFeatures)
     mons: list[MonInfo] = Field(default_factory=list)
@@ -1792,46 +1834,46 @@ class MonMap(CephBaseModel):
 class OSDInfo(CephBaseModel):
     """Schema for OSD information in osdmap."""
 
-    osd: int = Field(default=0)
-    uuid: str = Field(default="")
-    up: int = Field(default=0)
+    osd: int = 0
+    uuid: str = ""
+    up: int = 0
     in_field: int = Field(default=0, alias="in")
-    weight: float = Field(default=0.0)
-    primary_affinity: float = Field(default=1.0)
-    last_clean_begin: int = Field(default=0)
-    last_clean_end: int = Field(default=0)
-    up_from: int = Field(default=0)
-    up_thru: int = Field(default=0)
-    down_at: int = Field(default=0)
-    lost_at: int = Field(default=0)
+    weight: float = 0.0
+    primary_affinity: float = 1.0
+    last_clean_begin: int = 0
+    last_clean_end: int = 0
+    up_from: int = 0
+    up_thru: int = 0
+    down_at: int = 0
+    lost_at: int = 0
     public_addrs: dict[str, Any] = Field(default_factory=dict)
     cluster_addrs: dict[str, Any] = Field(default_factory=dict)
     heartbeat_back_addrs: dict[str, Any] = Field(default_factory=dict)
     heartbeat_front_addrs: dict[str, Any] = Field(default_factory=dict)
-    public_addr: str = Field(default="")
-    cluster_addr: str = Field(default="")
-    heartbeat_back_addr: str = Field(default="")
-    heartbeat_front_addr: str = Field(default="")
+    public_addr: str = ""
+    cluster_addr: str = ""
+    heartbeat_back_addr: str = ""
+    heartbeat_front_addr: str = ""
     state: list[str] = Field(default_factory=list)
 
 
 class OSDMap(CephBaseModel):
     """Schema for OSD map."""
 
-    epoch: int = Field(default=0)
-    fsid: str = Field(default="")
-    created: str = Field(default="")
-    modified: str = Field(default="")
-    flags: str = Field(default="")
-    flags_num: int = Field(default=0)
+    epoch: int = 0
+    fsid: str = ""
+    created: str = ""
+    modified: str = ""
+    flags: str = ""
+    flags_num: int = 0
     flags_set: list[str] = Field(default_factory=list)
-    crush_version: int = Field(default=0)
-    full_ratio: float = Field(default=0.0)
-    backfillfull_ratio: float = Field(default=0.0)
-    nearfull_ratio: float = Field(default=0.0)
-    min_compat_client: str = Field(default="")
-    require_min_compat_client: str = Field(default="")
-    require_osd_release: str = Field(default="")
+    crush_version: int = 0
+    full_ratio: float = 0.0
+    backfillfull_ratio: float = 0.0
+    nearfull_ratio: float = 0.0
+    min_compat_client: str = ""
+    require_min_compat_client: str = ""
+    require_osd_release: str = ""
     pools: list[PoolConfig] = Field(default_factory=list)
     osds: list[OSDInfo] = Field(default_factory=list)
     pg_upmap: list[Any] = Field(default_factory=list)
@@ -1845,60 +1887,60 @@ class OSDMap(CephBaseModel):
 class CrushTunables(CephBaseModel):
     """Schema for CRUSH tunables."""
 
-    choose_local_tries: int = Field(default=0)
-    choose_local_fallback_tries: int = Field(default=0)
-    choose_total_tries: int = Field(default=0)
-    chooseleaf_descend_once: int = Field(default=0)
-    chooseleaf_vary_r: int = Field(default=0)
-    chooseleaf_stable: int = Field(default=0)
-    straw_calc_version: int = Field(default=0)
-    allowed_bucket_algs: int = Field(default=0)
-    profile: str = Field(default="")
-    optimal_tunables: int = Field(default=0)
-    legacy_tunables: int = Field(default=0)
-    minimum_required_version: str = Field(default="")
-    require_feature_tunables: int = Field(default=0)
-    require_feature_tunables2: int = Field(default=0)
-    has_v2_rules: int = Field(default=0)
-    require_feature_tunables3: int = Field(default=0)
-    has_v3_rules: int = Field(default=0)
-    has_v4_buckets: int = Field(default=0)
-    require_feature_tunables5: int = Field(default=0)
-    has_v5_rules: int = Field(default=0)
+    choose_local_tries: int = 0
+    choose_local_fallback_tries: int = 0
+    choose_total_tries: int = 0
+    chooseleaf_descend_once: int = 0
+    chooseleaf_vary_r: int = 0
+    chooseleaf_stable: int = 0
+    straw_calc_version: int = 0
+    allowed_bucket_algs: int = 0
+    profile: str = ""
+    optimal_tunables: int = 0
+    legacy_tunables: int = 0
+    minimum_required_version: str = ""
+    require_feature_tunables: int = 0
+    require_feature_tunables2: int = 0
+    has_v2_rules: int = 0
+    require_feature_tunables3: int = 0
+    has_v3_rules: int = 0
+    has_v4_buckets: int = 0
+    require_feature_tunables5: int = 0
+    has_v5_rules: int = 0
 
 
 class CrushDevice(CephBaseModel):
     """Schema for CRUSH device entry."""
 
     device_id: int = Field(default=0, alias="id")
-    name: str = Field(default="")
+    name: str = ""
     device_class: str = Field(default="", alias="class")
 
 
 class CrushType(CephBaseModel):
     """Schema for CRUSH type entry."""
 
-    type_id: int = Field(default=0)
-    name: str = Field(default="")
+    type_id: int = 0
+    name: str = ""
 
 
 class CrushBucketItem(CephBaseModel):
     """Schema for item within a CRUSH bucket."""
 
     item_id: int = Field(default=0, alias="id")
-    weight: int = Field(default=0)
-    pos: int = Field(default=0)
+    weight: int = 0
+    pos: int = 0
 
 
 class CrushBucket(CephBaseModel):
     """Schema for CRUSH bucket (host, rack, root, etc.)."""
 
     bucket_id: int = Field(default=0, alias="id")
-    name: str = Field(default="")
-    type_id: int = Field(default=0)
-    type_name: str = Field(default="")
-    weight: int = Field(default=0)
-    alg: str = Field(default="straw2")
+    name: str = ""
+    type_id: int = 0
+    type_name: str = ""
+    weight: int = 0
+    alg: str = "straw2"
     hash_function: str = Field(default="rjenkins1", alias="hash")
     items: list[CrushBucketItem] = Field(default_factory=list)
 
@@ -1906,18 +1948,18 @@ class CrushBucket(CephBaseModel):
 class CrushRuleStep(CephBaseModel):
     """Schema for a step in a CRUSH rule."""
 
-    op: str = Field(default="")
-    item: int | None = Field(default=None)
-    item_name: str | None = Field(default=None)
-    num: int | None = Field(default=None)
+    op: str = ""
+    item: int | None = None
+    item_name: str | None = None
+    num: int | None = None
     rule_type: str | None = Field(default=None, alias="type")
 
 
 class CrushRule(CephBaseModel):
     """Schema for CRUSH rule."""
 
-    rule_id: int = Field(default=0)
-    rule_name: str = Field(default="")
+    rule_id: int = 0
+    rule_name: str = ""
     rule_type: int = Field(default=1, alias="type")
     steps: list[CrushRuleStep] = Field(default_factory=list)
 
@@ -1936,92 +1978,92 @@ class CrushMap(CephBaseModel):
 class OSDMetadata(CephBaseModel):
     """Schema for OSD metadata."""
 
-    id: int = Field(default=0)
-    arch: str = Field(default="")
-    back_addr: str = Field(default="")
-    back_iface: str = Field(default="")
-    bluefs: str = Field(default="")
-    bluefs_db_access_mode: str = Field(default="")
-    bluefs_db_block_size: str = Field(default="")
-    bluefs_db_dev: str = Field(default="")
-    bluefs_db_dev_node: str = Field(default="")
-    bluefs_db_driver: str = Field(default="")
-    bluefs_db_model: str = Field(default="")
-    bluefs_db_partition_path: str = Field(default="")
-    bluefs_db_rotational: str = Field(default="")
-    bluefs_db_serial: str = Field(default="")
-    bluefs_db_size: str = Field(default="")
-    bluefs_db_type: str = Field(default="")
-    bluefs_dedicated_db: str = Field(default="")
-    bluefs_dedicated_wal: str = Field(default="")
-    bluefs_single_shared_device: str = Field(default="")
-    bluestore_bdev_access_mode: str = Field(default="")
-    bluestore_bdev_block_size: str = Field(default="")
-    bluestore_bdev_dev: str = Field(default="")
-    bluestore_bdev_dev_node: str = Field(default="")
-    bluestore_bdev_driver: str = Field(default="")
-    bluestore_bdev_model: str = Field(default="")
-    bluestore_bdev_partition_path: str = Field(default="")
-    bluestore_bdev_rotational: str = Field(default="")
-    bluestore_bdev_serial: str = Field(default="")
-    bluestore_bdev_size: str = Field(default="")
-    bluestore_bdev_type: str = Field(default="")
-    ceph_release: str = Field(default="")
-    ceph_version: str = Field(default="")
-    ceph_version_short: str = Field(default="")
-    cpu: str = Field(default="")
-    default_device_class: str = Field(default="")
-    devices: str = Field(default="")
-    distro: str = Field(default="")
-    distro_description: str = Field(default="")
-    distro_version: str = Field(default="")
-    front_addr: str = Field(default="")
-    front_iface: str = Field(default="")
-    hb_back_addr: str = Field(default="")
-    hb_front_addr: str = Field(default="")
-    hostname: str = Field(default="")
-    journal_rotational: str = Field(default="")
-    kernel_description: str = Field(default="")
-    kernel_version: str = Field(default="")
-    mem_swap_kb: str = Field(default="")
-    mem_total_kb: str = Field(default="")
-    objectstore: str = Field(default="")
-    os: str = Field(default="")
-    osd_data: str = Field(default="")
-    osd_objectstore: str = Field(default="")
-    rotational: str = Field(default="")
+    id: int = 0
+    arch: str = ""
+    back_addr: str = ""
+    back_iface: str = ""
+    bluefs: str = ""
+    bluefs_db_access_mode: str = ""
+    bluefs_db_block_size: str = ""
+    bluefs_db_dev: str = ""
+    bluefs_db_dev_node: str = ""
+    bluefs_db_driver: str = ""
+    bluefs_db_model: str = ""
+    bluefs_db_partition_path: str = ""
+    bluefs_db_rotational: str = ""
+    bluefs_db_serial: str = ""
+    bluefs_db_size: str = ""
+    bluefs_db_type: str = ""
+    bluefs_dedicated_db: str = ""
+    bluefs_dedicated_wal: str = ""
+    bluefs_single_shared_device: str = ""
+    bluestore_bdev_access_mode: str = ""
+    bluestore_bdev_block_size: str = ""
+    bluestore_bdev_dev: str = ""
+    bluestore_bdev_dev_node: str = ""
+    bluestore_bdev_driver: str = ""
+    bluestore_bdev_model: str = ""
+    bluestore_bdev_partition_path: str = ""
+    bluestore_bdev_rotational: str = ""
+    bluestore_bdev_serial: str = ""
+    bluestore_bdev_size: str = ""
+    bluestore_bdev_type: str = ""
+    ceph_release: str = ""
+    ceph_version: str = ""
+    ceph_version_short: str = ""
+    cpu: str = ""
+    default_device_class: str = ""
+    devices: str = ""
+    distro: str = ""
+    distro_description: str = ""
+    distro_version: str = ""
+    front_addr: str = ""
+    front_iface: str = ""
+    hb_back_addr: str = ""
+    hb_front_addr: str = ""
+    hostname: str = ""
+    journal_rotational: str = ""
+    kernel_description: str = ""
+    kernel_version: str = ""
+    mem_swap_kb: str = ""
+    mem_total_kb: str = ""
+    objectstore: str = ""
+    os: str = ""
+    osd_data: str = ""
+    osd_objectstore: str = ""
+    rotational: str = ""
 
 
 class CephReport(CephBaseModel):
     """Schema for Ceph cluster diagnostic report."""
 
-    cluster_fingerprint: str = Field(default="")
-    version: str = Field(default="")
-    commit: str = Field(default="")
-    timestamp: str = Field(default="")
-    tag: str = Field(default="")
+    cluster_fingerprint: str = ""
+    version: str = ""
+    commit: str = ""
+    timestamp: str = ""
+    tag: str = ""
     health: Health = Field(default_factory=Health)
     monmap: MonMap = Field(default_factory=MonMap)
-    monmap_first_committed: int = Field(default=0)
-    monmap_last_committed: int = Field(default=0)
+    monmap_first_committed: int = 0
+    monmap_last_committed: int = 0
     osdmap: OSDMap = Field(default_factory=OSDMap)
-    osdmap_first_committed: int = Field(default=0)
-    osdmap_last_committed: int = Field(default=0)
+    osdmap_first_committed: int = 0
+    osdmap_last_committed: int = 0
     osdmap_clean_epochs: dict[str, Any] = Field(default_factory=dict)
     crushmap: CrushMap = Field(default_factory=CrushMap)
     fsmap: FSMap = Field(default_factory=FSMap)
-    mdsmap_first_committed: int = Field(default=0)
-    mdsmap_last_committed: int = Field(default=0)
+    mdsmap_first_committed: int = 0
+    mdsmap_last_committed: int = 0
     osd_metadata: list[OSDMetadata] = Field(default_factory=list)
     osd_stats: list[OSDStat] = Field(default_factory=list)
     osd_sum: OSDStatsSum = Field(default_factory=OSDStatsSum)
     osd_sum_by_class: dict[str, OSDStatsSum] = Field(default_factory=dict)
     pool_stats: list[PoolStat] = Field(default_factory=list)
     pool_sum: PGStatsSum = Field(default_factory=PGStatsSum)
-    num_osd: int = Field(default=0)
-    num_pg: int = Field(default=0)
-    num_pg_active: int = Field(default=0)
-    num_pg_unknown: int = Field(default=0)
+    num_osd: int = 0
+    num_pg: int = 0
+    num_pg_active: int = 0
+    num_pg_unknown: int = 0
     num_pg_by_state: list[dict[str, Any]] = Field(default_factory=list)
     num_pg_by_osd: list[dict[str, Any]] = Field(default_factory=list)
     purged_snaps: list[Any] = Field(default_factory=list)
@@ -2031,8 +2073,8 @@ class CephReport(CephBaseModel):
     auth: dict[str, Any] = Field(default_factory=dict)
 
     @classmethod
-    def loads(cls, raw: str) -> CephReport:
-        """Parse Ceph report from JSON string."""
+    def loads(cls, raw: str | bytes) -> CephReport:
+        """Parse Ceph report from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -2041,9 +2083,10 @@ class CephReport(CephBaseModel):
     @classmethod
     def load(cls, path: pathlib.Path) -> CephReport:
         """Load and parse Ceph report from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
@@ -2052,23 +2095,23 @@ class RGWZonegroupZoneEntry(CephBaseModel):
     """Schema for zone group zone entry."""
 
     zone_id: str = Field(default="", alias="id")
-    name: str = Field(default="")
+    name: str = ""
     endpoints: list[str] = Field(default_factory=list)
-    log_meta: bool = Field(default=False)
-    log_data: bool = Field(default=False)
-    bucket_index_max_shards: int = Field(default=0)
-    read_only: bool = Field(default=False)
-    tier_type: str = Field(default="")
-    sync_from_all: bool = Field(default=True)
+    log_meta: bool = False
+    log_data: bool = False
+    bucket_index_max_shards: int = 0
+    read_only: bool = False
+    tier_type: str = ""
+    sync_from_all: bool = True
     sync_from: list[str] = Field(default_factory=list)
-    redirect_zone: str = Field(default="")
+    redirect_zone: str = ""
     supported_features: list[str] = Field(default_factory=list)
 
 
 class RGWZonegroupPlacementTarget(CephBaseModel):
     """Schema for placement target in zonegroup."""
 
-    name: str = Field(default="")
+    name: str = ""
     tags: list[str] = Field(default_factory=list)
     storage_classes: list[str] = Field(default_factory=list)
 
@@ -2083,23 +2126,23 @@ class RGWZonegroupResponse(CephBaseModel):
     """Schema for `radosgw-admin zonegroup get --zonegroup-id <zonegroup_id> --format=json` response."""
 
     zonegroup_id: str = Field(default="", alias="id")
-    name: str = Field(default="")
-    api_name: str = Field(default="")
-    is_master: bool = Field(default=False)
+    name: str = ""
+    api_name: str = ""
+    is_master: bool = False
     endpoints: list[str] = Field(default_factory=list)
     hostnames: list[str] = Field(default_factory=list)
     hostnames_s3website: list[str] = Field(default_factory=list)
-    master_zone: str = Field(default="")
+    master_zone: str = ""
     zones: list[RGWZonegroupZoneEntry] = Field(default_factory=list)
     placement_targets: list[RGWZonegroupPlacementTarget] = Field(default_factory=list)
-    default_placement: str = Field(default="")
-    realm_id: str = Field(default="")
+    default_placement: str = ""
+    realm_id: str = ""
     sync_policy: RGWZonegroupSyncPolicy = Field(default_factory=RGWZonegroupSyncPolicy)
     enabled_features: list[str] = Field(default_factory=list)
 
     @classmethod
-    def loads(cls, raw: str) -> RGWZonegroupResponse:
-        """Parse RGW zonegroup from JSON string."""
+    def loads(cls, raw: str | bytes) -> RGWZonegroupResponse:
+        """Parse RGW zonegroup from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -2108,9 +2151,10 @@ class RGWZonegroupResponse(CephBaseModel):
     @classmethod
     def load(cls, path: pathlib.Path) -> RGWZonegroupResponse:
         """Load and parse RGW zonegroup from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
@@ -2120,62 +2164,62 @@ class RGWZonegroupResponse(CephBaseModel):
 class RGWZoneSystemKey(CephBaseModel):
     """Schema for RGW zone system key."""
 
-    access_key: str = Field(default="")
-    secret_key: str = Field(default="")
+    access_key: str = ""
+    secret_key: str = ""
 
 
 class RGWZonePlacementPoolStorageClass(CephBaseModel):
     """Schema for RGW storage class entry in placement pool."""
 
-    data_pool: str = Field(default="")
+    data_pool: str = ""
 
 
 class RGWZonePlacementPoolVal(CephBaseModel):
     """Schema for RGW zone placement pool value."""
 
-    index_pool: str = Field(default="")
+    index_pool: str = ""
     storage_classes: dict[str, RGWZonePlacementPoolStorageClass] = Field(
         default_factory=dict
     )
-    data_extra_pool: str | None = Field(default=None)
-    index_type: int = Field(default=0)
-    inline_data: bool = Field(default=False)
+    data_extra_pool: str | None = None
+    index_type: int = 0
+    inline_data: bool = False
 
 
 class RGWZonePlacementPool(CephBaseModel):
     """Schema for RGW zone placement pool entry."""
 
-    key: str = Field(default="")
+    key: str = ""
     val: RGWZonePlacementPoolVal = Field(default_factory=RGWZonePlacementPoolVal)
 
 
 class RGWZoneResponse(CephBaseModel):
     """Schema for `radosgw-admin zone get --zone-id <zone_id> --format=json` response."""
 
-    zone_id: str = Field(default="")
-    name: str = Field(default="")
-    domain_root: str = Field(default="")
-    control_pool: str = Field(default="")
-    gc_pool: str = Field(default="")
-    lc_pool: str = Field(default="")
-    log_pool: str = Field(default="")
-    intent_log_pool: str = Field(default="")
-    usage_log_pool: str = Field(default="")
-    roles_pool: str = Field(default="")
-    reshard_pool: str = Field(default="")
-    user_keys_pool: str = Field(default="")
-    user_email_pool: str = Field(default="")
-    user_swift_pool: str = Field(default="")
-    user_uid_pool: str = Field(default="")
-    otp_pool: str = Field(default="")
+    zone_id: str = ""
+    name: str = ""
+    domain_root: str = ""
+    control_pool: str = ""
+    gc_pool: str = ""
+    lc_pool: str = ""
+    log_pool: str = ""
+    intent_log_pool: str = ""
+    usage_log_pool: str = ""
+    roles_pool: str = ""
+    reshard_pool: str = ""
+    user_keys_pool: str = ""
+    user_email_pool: str = ""
+    user_swift_pool: str = ""
+    user_uid_pool: str = ""
+    otp_pool: str = ""
     system_key: RGWZoneSystemKey = Field(default_factory=RGWZoneSystemKey)
     placement_pools: list[RGWZonePlacementPool] = Field(default_factory=list)
-    realm_id: str = Field(default="")
-    notif_pool: str | None = Field(default=None)
+    realm_id: str = ""
+    notif_pool: str | None = None
 
     @classmethod
-    def loads(cls, raw: str) -> RGWZoneResponse:
-        """Parse RGW zone from JSON string."""
+    def loads(cls, raw: str | bytes) -> RGWZoneResponse:
+        """Parse RGW zone from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -2184,9 +2228,10 @@ class RGWZoneResponse(CephBaseModel):
     @classmethod
     def load(cls, path: pathlib.Path) -> RGWZoneResponse:
         """Load and parse RGW zone from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
@@ -2203,8 +2248,8 @@ class RGWBucketListResponse(RootModel[list[str]]):
         return len(self.root)
 
     @classmethod
-    def loads(cls, raw: str) -> RGWBucketListResponse:
-        """Parse RGW bucket list from JSON string."""
+    def loads(cls, raw: str | bytes) -> RGWBucketListResponse:
+        """Parse RGW bucket list from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -2213,48 +2258,49 @@ class RGWBucketListResponse(RootModel[list[str]]):
     @classmethod
     def load(cls, path: pathlib.Path) -> RGWBucketListResponse:
         """Load and parse RGW bucket list from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
 class RGWBucketObjectVersion(CephBaseModel):
     """Schema for RGW bucket object version."""
 
-    pool: int = Field(default=0)
-    epoch: int = Field(default=0)
+    pool: int = 0
+    epoch: int = 0
 
 
 class RGWBucketObjectMetadata(CephBaseModel):
     """Schema for RGW bucket object metadata."""
 
-    category: int = Field(default=0)
-    size: int = Field(default=0)
-    mtime: str = Field(default="")
-    etag: str = Field(default="")
-    storage_class: str = Field(default="")
-    owner: str = Field(default="")
-    owner_display_name: str = Field(default="")
-    content_type: str = Field(default="")
-    accounted_size: int = Field(default=0)
-    user_data: str = Field(default="")
-    appendable: bool = Field(default=False)
+    category: int = 0
+    size: int = 0
+    mtime: str = ""
+    etag: str = ""
+    storage_class: str = ""
+    owner: str = ""
+    owner_display_name: str = ""
+    content_type: str = ""
+    accounted_size: int = 0
+    user_data: str = ""
+    appendable: bool = False
 
 
 class RGWBucketObject(CephBaseModel):
     """Schema for RGW bucket object entry."""
 
-    name: str = Field(default="")
-    instance: str = Field(default="")
+    name: str = ""
+    instance: str = ""
     ver: RGWBucketObjectVersion = Field(default_factory=RGWBucketObjectVersion)
-    locator: str = Field(default="")
-    exists: bool = Field(default=False)
+    locator: str = ""
+    exists: bool = False
     meta: RGWBucketObjectMetadata = Field(default_factory=RGWBucketObjectMetadata)
-    tag: str = Field(default="")
-    flags: int = Field(default=0)
+    tag: str = ""
+    flags: int = 0
     pending_map: list[Any] = Field(default_factory=list)
-    versioned_epoch: int = Field(default=0)
+    versioned_epoch: int = 0
 
 
 class RGWBucketObjectListResponse(RootModel[list[RGWBucketObject]]):
@@ -2270,8 +2316,8 @@ class RGWBucketObjectListResponse(RootModel[list[RGWBucketObject]]):
         return self.root[item]
 
     @classmethod
-    def loads(cls, raw: str) -> RGWBucketObjectListResponse:
-        """Parse RGW bucket object list from JSON string."""
+    def loads(cls, raw: str | bytes) -> RGWBucketObjectListResponse:
+        """Parse RGW bucket object list from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -2282,9 +2328,10 @@ class RGWBucketObjectListResponse(RootModel[list[RGWBucketObject]]):
     @classmethod
     def load(cls, path: pathlib.Path) -> RGWBucketObjectListResponse:
         """Load and parse RGW bucket object list from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
@@ -2294,58 +2341,58 @@ class RGWBucketObjectListResponse(RootModel[list[RGWBucketObject]]):
 class RGWBucketExplicitPlacement(CephBaseModel):
     """Schema for explicit placement in bucket stats."""
 
-    data_pool: str = Field(default="")
-    data_extra_pool: str = Field(default="")
-    index_pool: str = Field(default="")
+    data_pool: str = ""
+    data_extra_pool: str = ""
+    index_pool: str = ""
 
 
 class RGWBucketUsageStats(CephBaseModel):
     """Schema for usage statistics per category."""
 
-    size: int = Field(default=0)
-    size_actual: int = Field(default=0)
-    size_utilized: int = Field(default=0)
-    size_kb: int = Field(default=0)
-    size_kb_actual: int = Field(default=0)
-    size_kb_utilized: int = Field(default=0)
-    num_objects: int = Field(default=0)
+    size: int = 0
+    size_actual: int = 0
+    size_utilized: int = 0
+    size_kb: int = 0
+    size_kb_actual: int = 0
+    size_kb_utilized: int = 0
+    num_objects: int = 0
 
 
 class RGWBucketQuota(CephBaseModel):
     """Schema for bucket quota settings."""
 
-    enabled: bool = Field(default=False)
-    check_on_raw: bool = Field(default=False)
-    max_size: int = Field(default=-1)
-    max_size_kb: int = Field(default=0)
-    max_objects: int = Field(default=-1)
+    enabled: bool = False
+    check_on_raw: bool = False
+    max_size: int = -1
+    max_size_kb: int = 0
+    max_objects: int = -1
 
 
 class RGWBucketStatsEntry(CephBaseModel):
     """Schema for individual bucket statistics entry."""
 
-    bucket: str = Field(default="")
-    num_shards: int = Field(default=0)
-    tenant: str = Field(default="")
-    versioning: str = Field(default="")
-    zonegroup: str = Field(default="")
-    placement_rule: str = Field(default="")
+    bucket: str = ""
+    num_shards: int = 0
+    tenant: str = ""
+    versioning: str = ""
+    zonegroup: str = ""
+    placement_rule: str = ""
     explicit_placement: RGWBucketExplicitPlacement = Field(
         default_factory=RGWBucketExplicitPlacement
     )
     bucket_id: str = Field(default="", alias="id")
-    marker: str = Field(default="")
-    index_type: str = Field(default="")
-    versioned: bool = Field(default=False)
-    versioning_enabled: bool = Field(default=False)
-    object_lock_enabled: bool = Field(default=False)
-    mfa_enabled: bool = Field(default=False)
-    owner: str = Field(default="")
-    ver: str = Field(default="")
-    master_ver: str = Field(default="")
-    mtime: str = Field(default="")
-    creation_time: str = Field(default="")
-    max_marker: str = Field(default="")
+    marker: str = ""
+    index_type: str = ""
+    versioned: bool = False
+    versioning_enabled: bool = False
+    object_lock_enabled: bool = False
+    mfa_enabled: bool = False
+    owner: str = ""
+    ver: str = ""
+    master_ver: str = ""
+    mtime: str = ""
+    creation_time: str = ""
+    max_marker: str = ""
     usage: dict[str, RGWBucketUsageStats] = Field(default_factory=dict)
     bucket_quota: RGWBucketQuota = Field(default_factory=RGWBucketQuota)
 
@@ -2363,8 +2410,8 @@ class RGWBucketStatsResponse(RootModel[list[RGWBucketStatsEntry]]):
         return self.root[item]
 
     @classmethod
-    def loads(cls, raw: str) -> RGWBucketStatsResponse:
-        """Parse RGW bucket stats from JSON string."""
+    def loads(cls, raw: str | bytes) -> RGWBucketStatsResponse:
+        """Parse RGW bucket stats from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -2375,9 +2422,10 @@ class RGWBucketStatsResponse(RootModel[list[RGWBucketStatsEntry]]):
     @classmethod
     def load(cls, path: pathlib.Path) -> RGWBucketStatsResponse:
         """Load and parse RGW bucket stats from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
@@ -2387,11 +2435,11 @@ class RGWBucketStatsResponse(RootModel[list[RGWBucketStatsEntry]]):
 class RGWQuotaSettings(CephBaseModel):
     """Schema for RGW quota settings (bucket or user)."""
 
-    enabled: bool = Field(default=False)
-    check_on_raw: bool = Field(default=False)
-    max_size: int = Field(default=-1)
-    max_size_kb: int = Field(default=0)
-    max_objects: int = Field(default=-1)
+    enabled: bool = False
+    check_on_raw: bool = False
+    max_size: int = -1
+    max_size_kb: int = 0
+    max_objects: int = -1
 
 
 class RGWGlobalQuotaResponse(CephBaseModel):
@@ -2401,8 +2449,8 @@ class RGWGlobalQuotaResponse(CephBaseModel):
     user_quota: RGWQuotaSettings = Field(alias="user quota")
 
     @classmethod
-    def loads(cls, raw: str) -> RGWGlobalQuotaResponse:
-        """Parse RGW global quota from JSON string."""
+    def loads(cls, raw: str | bytes) -> RGWGlobalQuotaResponse:
+        """Parse RGW global quota from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -2413,9 +2461,10 @@ class RGWGlobalQuotaResponse(CephBaseModel):
     @classmethod
     def load(cls, path: pathlib.Path) -> RGWGlobalQuotaResponse:
         """Load and parse RGW global quota from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
@@ -2432,8 +2481,8 @@ class RGWUserListResponse(RootModel[list[str]]):
         return self.root[item]
 
     @classmethod
-    def loads(cls, raw: str) -> RGWUserListResponse:
-        """Parse RGW user list from JSON string."""
+    def loads(cls, raw: str | bytes) -> RGWUserListResponse:
+        """Parse RGW user list from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -2442,35 +2491,36 @@ class RGWUserListResponse(RootModel[list[str]]):
     @classmethod
     def load(cls, path: pathlib.Path) -> RGWUserListResponse:
         """Load and parse RGW user list from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
 
 
 class RGWUserKey(CephBaseModel):
     """Schema for RGW user key."""
 
-    user: str = Field(default="")
-    access_key: str = Field(default="")
-    secret_key: str = Field(default="")
+    user: str = ""
+    access_key: str = ""
+    secret_key: str = ""
 
 
 class RGWUserInfoResponse(CephBaseModel):
     """Schema for `radosgw-admin user info` response."""
 
-    user_id: str = Field(default="")
-    display_name: str = Field(default="")
-    email: str = Field(default="")
-    suspended: int = Field(default=0)
-    max_buckets: int = Field(default=1000)
+    user_id: str = ""
+    display_name: str = ""
+    email: str = ""
+    suspended: int = 0
+    max_buckets: int = 1000
     subusers: list[Any] = Field(default_factory=list)
     keys: list[RGWUserKey] = Field(default_factory=list)
     swift_keys: list[Any] = Field(default_factory=list)
     caps: list[Any] = Field(default_factory=list)
-    op_mask: str = Field(default="")
-    default_placement: str = Field(default="")
-    default_storage_class: str = Field(default="")
+    op_mask: str = ""
+    default_placement: str = ""
+    default_storage_class: str = ""
     placement_tags: list[str] = Field(default_factory=list)
     bucket_quota: RGWQuotaSettings = Field(default_factory=RGWQuotaSettings)
     user_quota: RGWQuotaSettings = Field(default_factory=RGWQuotaSettings)
@@ -2479,8 +2529,8 @@ class RGWUserInfoResponse(CephBaseModel):
     mfa_ids: list[str] = Field(default_factory=list)
 
     @classmethod
-    def loads(cls, raw: str) -> RGWUserInfoResponse:
-        """Parse RGW user info from JSON string."""
+    def loads(cls, raw: str | bytes) -> RGWUserInfoResponse:
+        """Parse RGW user info from JSON string or bytes."""
         try:
             return cls.model_validate_json(raw)
         except Exception as e:
@@ -2489,33 +2539,8 @@ class RGWUserInfoResponse(CephBaseModel):
     @classmethod
     def load(cls, path: pathlib.Path) -> RGWUserInfoResponse:
         """Load and parse RGW user info from file."""
-        if not path.exists() or not path.is_file():
-            raise FileNotFoundError(f"File not found: {path}")
-        raw = path.read_text()
+        try:
+            raw = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
         return cls.loads(raw)
-
-
-# to resolve forward references
-_ = OSDTree.model_rebuild()
-_ = PGDump.model_rebuild()
-_ = OSDDFResponse.model_rebuild()
-_ = OSDDumpResponse.model_rebuild()
-_ = OSDPerfDumpResponse.model_rebuild()
-_ = CephReport.model_rebuild()
-_ = RGWZoneResponse.model_rebuild()
-_ = RGWBucketListResponse.model_rebuild()
-_ = RGWBucketObjectListResponse.model_rebuild()
-
-
-# to resolve forward references
-_ = OSDTree.model_rebuild()
-_ = PGDump.model_rebuild()
-_ = OSDDFResponse.model_rebuild()
-_ = OSDDumpResponse.model_rebuild()
-_ = OSDPerfDumpResponse.model_rebuild()
-_ = CephfsStatusResponse.model_rebuild()
-_ = CephfsMDSStatResponse.model_rebuild()
-_ = CephReport.model_rebuild()
-_ = RGWZoneResponse.model_rebuild()
-_ = RGWBucketListResponse.model_rebuild()
-_ = RGWBucketObjectListResponse.model_rebuild()
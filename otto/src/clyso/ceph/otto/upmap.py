@@ -3,8 +3,8 @@
 
 import os
 import sys
-import subprocess
 import argparse
+from functools import lru_cache
 
 
 def add_command_upmap_remapped(subparsers) -> None:
@@ -58,36 +58,24 @@ def upmap_remapped(args: argparse.Namespace) -> None:
     if args.ignore_backfilling:
         cmd.append("--ignore-backfilling")
 
-    process = None
+    # replace this process with the script; its exit status becomes ours
+    sys.stdout.flush()
+    sys.stderr.flush()
     try:
-        process = subprocess.Popen(cmd)
-        return_code = process.wait()
-    except KeyboardInterrupt:
-        if process:
-            process.terminate()
-            return_code = process.wait()
-        else:
-            print(
-                "Process creation interrupted or failed before start.", file=sys.stderr
-            )
-            exit(1)
-
-    if return_code != 0:
-        print(f"Error: Upmap script failed with code {return_code}", file=sys.stderr)
-        exit(return_code)
+        os.execv(upmap_script, cmd)
+    except OSError as e:
+        print(f"Error: Failed to run upmap script {upmap_script}: {e}", file=sys.stderr)
+        exit(1)
 
 
+@lru_cache(maxsize=1)
 def get_tools_dir() -> str:
     """Get the directory containing the tools."""
-    tools_dir_candidates = [
+    tools_dir_candidates = (
         os.path.abspath(os.path.join(os.path.dirname(__file__), "tools")),
         "/usr/libexec/otto/tools",
         "/usr/share/otto/tools",
         "/usr/lib/otto/tools",
-    ]
-
-    for tools_dir in tools_dir_candidates:
-        if os.path.exists(tools_dir):
-            return tools_dir
+    )
 
-    return ""
+    return next((d for d in tools_dir_candidates if os.path.isdir(d)), "")
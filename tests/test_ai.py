@@ -1,9 +1,14 @@
 # Copyright (C) 2025 Clyso
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import contextlib
+import io
 import json
+import subprocess
+import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import clyso.ceph.ai as ai_module
 from clyso.ceph.ai.data import CephData
@@ -304,5 +309,109 @@ class TestClysoCephAI(unittest.TestCase):
             )
 
 
+class TestCephFacts(unittest.TestCase):
+    def _facts(self, report_file: str):
+        from clyso.ceph.ai.facts import CephFacts
+        from clyso.ceph.api.loaders import load_ceph_report
+
+        data = CephData()
+        data.ceph_report = load_ceph_report(str(Path(__file__).parent / report_file))
+        return CephFacts(data)
+
+    def test_separate_cluster_network(self) -> None:
+        self.assertFalse(
+            self._facts("report.pacific.json").has_separate_cluster_network
+        )
+        self.assertFalse(self._facts("report.squid.json").has_separate_cluster_network)
+        self.assertTrue(self._facts("reports/08.json").has_separate_cluster_network)
+
+    def test_strip_port(self) -> None:
+        from clyso.ceph.ai.facts import _strip_port
+
+        self.assertEqual(_strip_port("10.0.0.1:6801/1234"), "10.0.0.1")
+        self.assertEqual(_strip_port("[fd00::1]:6801/1234"), "fd00::1")
+        self.assertEqual(_strip_port("v2:10.0.0.1:6800/1234"), "10.0.0.1")
+        self.assertEqual(_strip_port(":/0"), "")
+
+
+class TestOSDPerf(unittest.TestCase):
+    def test_collect_osd_performance_metrics(self) -> None:
+        from clyso.ceph.ai.osd.perf import OSDMetric, OSDPerf
+
+        def collect(osd_id: int) -> list[OSDMetric]:
+            if osd_id == 2:
+                raise RuntimeError
+            return [
+                OSDMetric(
+                    osd_id="unknown",
+                    host="unknown",
+                    device_class="unknown",
+                    onode_hits=osd_id,
+                    onode_misses=1,
+                    onode_hitrate=0.5,
+                )
+            ]
+
+        osd_metadata = {1: {"hostname": "host1", "device_class": "ssd"}}
+        with mock.patch.object(
+            OSDPerf, "collect_single_osd_metrics", side_effect=collect
+        ):
+            metrics, failed = OSDPerf.collect_osd_performance_metrics(
+                [3, 1, 2, 0], osd_metadata
+            )
+
+        self.assertEqual([m.onode_hits for m in metrics], [3, 1, 0])
+        self.assertEqual(metrics[1].osd_id, 1)
+        self.assertEqual(metrics[1].host, "host1")
+        self.assertEqual(metrics[1].device_class, "ssd")
+        self.assertEqual(failed, [2])
+
+    def test_analyze_onode_distribution(self) -> None:
+        import statistics
+
+        from clyso.ceph.ai.osd.perf import OSDMetric, analyze_onode_distribution
+
+        rates = [0.9, 0.5, 0.75, 0.99, 0.1]
+        metrics = [
+            OSDMetric(
+                osd_id=osd_id,
+                host="unknown",
+                device_class="unknown",
+                onode_hits=0,
+                onode_misses=0,
+                onode_hitrate=rate,
+            )
+            for osd_id, rate in enumerate(rates)
+        ]
+        analysis = analyze_onode_distribution(metrics)
+
+        self.assertEqual(analysis.total_osds, 5)
+        self.assertAlmostEqual(analysis.mean_hitrate, statistics.mean(rates))
+        self.assertEqual(analysis.median_hitrate, 0.75)
+        self.assertEqual(analysis.min_hitrate, 0.1)
+        self.assertEqual(analysis.max_hitrate, 0.99)
+        self.assertIsNotNone(analysis.stdev_hitrate)
+        self.assertAlmostEqual(analysis.stdev_hitrate, statistics.stdev(rates))
+
+    def test_collect_stops_on_command_failure(self) -> None:
+        from clyso.ceph.ai.osd.perf import MAX_COLLECT_WORKERS, OSDPerf
+
+        def check_output(argv, **kwargs):
+            if "osd.0" in argv:
+                raise subprocess.CalledProcessError(1, argv)
+            time.sleep(0.01)
+            return b'{"bluestore": {"onode_hits": 1, "onode_misses": 1}}'
+
+        with (
+            mock.patch("subprocess.check_output", side_effect=check_output) as run,
+            contextlib.redirect_stdout(io.StringIO()),
+            self.assertRaises(SystemExit),
+        ):
+            OSDPerf.collect_osd_performance_metrics(list(range(200)), {})
+
+        # the OSDs still queued behind the failed one are never queried
+        self.assertLessEqual(run.call_count, 2 * MAX_COLLECT_WORKERS)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,156 @@
+# Copyright (C) 2025 Clyso
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+import argparse
+import math
+import pathlib
+import threading
+import time
+import unittest
+from unittest import mock
+
+from clyso.ceph.api import _json_utils, commands
+from clyso.ceph.api._json_utils import parse_ceph_json, validate_ceph_json
+from clyso.ceph.api.schemas import OSDTree, PGDumpLite
+from pydantic import ValidationError
+
+
+class TestParseCephJson(unittest.TestCase):
+    def _check_parse(self) -> None:
+        self.assertEqual(parse_ceph_json('{"a": [1, 2]}'), {"a": [1, 2]})
+        self.assertEqual(parse_ceph_json(b'{"a": "b"}'), {"a": "b"})
+
+        out = parse_ceph_json(b'{"a": inf, "b": -inf, "c": nan, "d": 1}')
+        self.assertEqual(out["a"], math.inf)
+        self.assertEqual(out["b"], -math.inf)
+        self.assertTrue(math.isnan(out["c"]))
+        self.assertEqual(out["d"], 1)
+
+        out = parse_ceph_json("[Infinity, NaN]")
+        self.assertEqual(out[0], math.inf)
+        self.assertTrue(math.isnan(out[1]))
+
+    def test_parse(self) -> None:
+        self._check_parse()
+
+    def test_parse_without_orjson(self) -> None:
+        with mock.patch.object(_json_utils, "orjson", None):
+            self._check_parse()
+
+
+class TestValidateCephJson(unittest.TestCase):
+    def test_validate_non_standard_constants(self) -> None:
+        raw = b'{"nodes": [{"id": 0, "crush_weight": inf, "reweight": 1.0}]}'
+        osd_tree = validate_ceph_json(OSDTree, raw)
+        self.assertEqual(osd_tree.nodes[0].crush_weight, math.inf)
+
+    def test_validate_reports_error(self) -> None:
+        with self.assertRaises(ValidationError):
+            validate_ceph_json(OSDTree, b'{"stray": []}')
+
+
+class TestSchemaLoad(unittest.TestCase):
+    def test_load_missing_file(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            OSDTree.load(pathlib.Path("tests/does-not-exist.json"))
+        with self.assertRaises(FileNotFoundError):
+            OSDTree.load(pathlib.Path("tests"))
+
+    def test_load_passes_other_errors(self) -> None:
+        with (
+            mock.patch.object(pathlib.Path, "read_bytes", side_effect=PermissionError),
+            self.assertRaises(PermissionError),
+        ):
+            OSDTree.load(pathlib.Path("tests/osd-tree.json"))
+
+
+class TestCommandArgv(unittest.TestCase):
+    def test_names_are_passed_as_single_arguments(self) -> None:
+        name = "o'brien test"
+        cases = [
+            (
+                commands.radosgw_admin_user_info,
+                ("radosgw-admin", "user", "info", "--uid", name, "--format=json"),
+            ),
+            (
+                commands.radosgw_admin_bucket_list_objects,
+                ("radosgw-admin", "bucket", "list", "--bucket", name, "--format=json"),
+            ),
+            (
+                commands.ceph_mds_session_ls,
+                ("ceph", "tell", f"mds.{name}", "session", "ls", "--format=json"),
+            ),
+        ]
+        for func, argv in cases:
+            with (
+                self.subTest(func=func.__name__),
+                mock.patch.object(
+                    commands, "_run_ceph_argv", return_value=b"{}"
+                ) as run,
+                mock.patch.object(commands, "validate_ceph_json"),
+            ):
+                func(name)
+                run.assert_called_once_with(argv)
+
+
+class TestFetchParallel(unittest.TestCase):
+    def test_results_in_argument_order(self) -> None:
+        def run(argv, timeout=30):
+            if argv == commands._CMD_OSD_TREE:
+                # finish after the pg dump
+                time.sleep(0.05)
+                return b'{"nodes": []}'
+            return b'{"pg_map": {"pg_stats": []}}'
+
+        with mock.patch.object(commands, "_run_ceph_argv", side_effect=run):
+            osd_tree, pg_dump = commands.ceph_fetch_parallel(
+                commands.ceph_osd_tree, commands.ceph_pg_dump_lite
+            )
+        self.assertIsInstance(osd_tree, OSDTree)
+        self.assertIsInstance(pg_dump, PGDumpLite)
+
+    def test_failure_does_not_wait(self) -> None:
+        release = threading.Event()
+
+        def run(argv, timeout=30):
+            if argv == commands._CMD_OSD_TREE:
+                raise SystemExit(1)
+            release.wait(10)
+            return b'{"pg_map": {"pg_stats": []}}'
+
+        start = time.monotonic()
+        try:
+            with (
+                mock.patch.object(commands, "_run_ceph_argv", side_effect=run),
+                self.assertRaises(SystemExit),
+            ):
+                commands.ceph_fetch_parallel(
+                    commands.ceph_osd_tree, commands.ceph_pg_dump_lite
+                )
+        finally:
+            release.set()
+        # raised while the pg dump was still blocked
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_pg_distribution_fetches_missing_maps(self) -> None:
+        from clyso.ceph.ai import pg
+
+        def run(argv, timeout=30):
+            if argv == commands._CMD_OSD_TREE:
+                return b'{"nodes": []}'
+            if argv == commands._CMD_PG_DUMP:
+                return b'{"pg_map": {"pg_stats": []}}'
+            raise AssertionError(argv)
+
+        args = argparse.Namespace(osd_tree_json=None, pg_dump_json=None)
+        with (
+            mock.patch.object(commands, "_run_ceph_argv", side_effect=run) as ceph,
+            mock.patch.object(pg, "PGHistogram") as histogram,
+        ):
+            pg.pg_distribution(args)
+
+        self.assertEqual(ceph.call_count, 2)
+        osd_tree, pg_dump, histogram_args = histogram.call_args.args
+        self.assertIsInstance(osd_tree, OSDTree)
+        self.assertIsInstance(pg_dump, PGDumpLite)
+        self.assertIs(histogram_args, args)